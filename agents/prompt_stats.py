@@ -0,0 +1,40 @@
+"""Per-turn prompt size and model-call accounting."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+
+
+@dataclass
+class TurnStats:
+    """Model usage for one turn (one runner invocation)."""
+
+    model_calls: int = 0
+    prompt_bytes: int = 0
+    max_tools: int = 0
+
+
+def prompt_bytes(llm_request: LlmRequest) -> int:
+    """Size of what is sent to the model: instruction, history and tool declarations."""
+    return len(llm_request.model_dump_json(include={"contents", "config"}, exclude_none=True))
+
+
+class PromptStatsPlugin(BasePlugin):
+    """Records model calls and prompt bytes per turn, keyed by invocation ID."""
+
+    def __init__(self, name: str = "prompt_stats"):
+        super().__init__(name)
+        self.turns: dict[str, TurnStats] = {}
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> LlmResponse | None:
+        stats = self.turns.setdefault(callback_context.invocation_id, TurnStats())
+        stats.model_calls += 1
+        stats.prompt_bytes += prompt_bytes(llm_request)
+        stats.max_tools = max(stats.max_tools, len(llm_request.tools_dict))
+        return None
@@ -0,0 +1,258 @@
+"""Record agent sessions and replay them offline.
+
+A recording is a directory with two JSONL files:
+
+- ``session.jsonl``, written by ``SessionRecorder`` (an ADK plugin): a
+  ``session`` header, then for each turn a ``turn`` record with the user's
+  input, one ``llm`` record per model call (the full request and every
+  response, partial ones included, with its offset from the start of the
+  call), one ``tool`` record per result from a tool that reaches outside
+  the process other than through MCP (e.g. image generation), and a
+  ``turn_end`` record with the turn's duration.
+- ``tcp.jsonl``, written by the MCP server when ``UE_TCP_RECORD`` points at
+  it: every exchange with the UE plugin.
+
+Starting a ``SessionRecorder`` empties both files, so a directory always
+holds a single session.
+
+``ReplayLlm`` and ``ReplayPlugin`` feed the recorded model outputs and tool
+results back to a runner; ``benchmarks.replay`` wires them up with a
+stand-in UE plugin that answers with the recorded TCP responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncGenerator
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.tools import BaseTool, ToolContext
+from google.adk.tools.mcp_tool.mcp_tool import McpTool
+from google.genai import types
+
+SESSION_FILE = "session.jsonl"
+TCP_FILE = "tcp.jsonl"
+
+# Tools that only act on the agent tree itself; they run normally on replay
+LOCAL_TOOLS = {"transfer_to_agent"}
+
+
+def _is_recorded_tool(tool: BaseTool) -> bool:
+    return not isinstance(tool, McpTool) and tool.name not in LOCAL_TOOLS
+
+
+def _request_json(llm_request: LlmRequest) -> dict:
+    request = llm_request.model_dump(mode="json", exclude_none=True, include={"model", "contents", "config"})
+    # Billing labels are added after the before-model callbacks run; they
+    # aren't part of the prompt
+    request.get("config", {}).pop("labels", None)
+    return request
+
+
+def _request_differs(recorded: dict, live: dict) -> bool:
+    """True if a replayed request is not the one recorded.
+
+    The config carries the system instruction, tool declarations and
+    generation settings. Of the contents only the count is compared, since
+    function call IDs are generated afresh on every run.
+    """
+    return (
+        recorded.get("config") != live.get("config")
+        or len(recorded.get("contents", [])) != len(live.get("contents", []))
+    )
+
+
+class SessionRecorder(BasePlugin):
+    """Appends a session's inputs, model calls and external tool results to a recording."""
+
+    def __init__(self, directory: str | Path, streaming: bool, name: str = "session_recorder"):
+        super().__init__(name)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / SESSION_FILE
+        # Truncated rather than appended to, so an earlier session's turns
+        # can't be counted against this one's
+        self.path.write_bytes(b"")
+        (self.directory / TCP_FILE).write_bytes(b"")
+        self._turn = 0
+        self._turn_started = 0.0
+        self._calls: dict[tuple[str, str], dict] = {}
+        self._write({"type": "session", "streaming": streaming, "started": time.time()})
+
+    async def on_user_message_callback(
+        self, *, invocation_context: InvocationContext, user_message: types.Content
+    ) -> types.Content | None:
+        self._turn += 1
+        self._turn_started = time.perf_counter()
+        text = " ".join(part.text for part in user_message.parts or [] if part.text)
+        self._write({"type": "turn", "turn": self._turn, "input": text, "started": time.time()})
+        return None
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> LlmResponse | None:
+        key = (callback_context.invocation_id, callback_context.agent_name)
+        self._calls[key] = {
+            "type": "llm",
+            "turn": self._turn,
+            "agent": callback_context.agent_name,
+            "request": _request_json(llm_request),
+            "responses": [],
+            "started": time.perf_counter(),
+        }
+        return None
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> LlmResponse | None:
+        key = (callback_context.invocation_id, callback_context.agent_name)
+        call = self._calls.get(key)
+        if call is None:
+            return None
+        call["responses"].append({
+            "at": time.perf_counter() - call["started"],
+            "response": json.loads(llm_response.model_dump_json(exclude_none=True)),
+        })
+        if not llm_response.partial:
+            del self._calls[key]
+            call.pop("started")
+            self._write(call)
+        return None
+
+    async def after_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext, result: dict
+    ) -> dict | None:
+        if _is_recorded_tool(tool):
+            # ADK wraps non-dict tool results the same way
+            response = result if isinstance(result, dict) else {"result": result}
+            self._write({"type": "tool", "turn": self._turn, "name": tool.name, "args": tool_args, "response": response})
+        return None
+
+    async def after_run_callback(self, *, invocation_context: InvocationContext) -> None:
+        self._write({
+            "type": "turn_end",
+            "turn": self._turn,
+            "elapsed": time.perf_counter() - self._turn_started,
+            "ended": time.time(),
+        })
+
+    def _write(self, record: dict) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+@dataclass
+class RecordedTurn:
+    input: str
+    started: float
+    elapsed: float = 0.0
+    ended: float = 0.0
+    model_calls: int = 0
+    ue_commands: int = 0
+
+
+@dataclass
+class Recording:
+    streaming: bool
+    turns: list[RecordedTurn] = field(default_factory=list)
+    llm_calls: list[dict] = field(default_factory=list)
+    tools: list[dict] = field(default_factory=list)
+    exchanges: list[dict] = field(default_factory=list)
+
+
+def load_recording(directory: str | Path) -> Recording:
+    """Read a recording directory written by ``SessionRecorder`` and the MCP server."""
+    directory = Path(directory)
+    records = [json.loads(line) for line in (directory / SESSION_FILE).read_text(encoding="utf-8").splitlines()]
+    header = records[0]
+    if header.get("type") != "session":
+        raise ValueError(f"{directory / SESSION_FILE} does not start with a session header")
+
+    recording = Recording(streaming=header["streaming"])
+    for record in records[1:]:
+        if record["type"] == "turn":
+            recording.turns.append(RecordedTurn(input=record["input"], started=record["started"]))
+        elif record["type"] == "llm":
+            recording.llm_calls.append(record)
+            recording.turns[record["turn"] - 1].model_calls += 1
+        elif record["type"] == "tool":
+            recording.tools.append(record)
+        elif record["type"] == "turn_end":
+            turn = recording.turns[record["turn"] - 1]
+            turn.elapsed, turn.ended = record["elapsed"], record["ended"]
+
+    tcp_path = directory / TCP_FILE
+    if tcp_path.exists():
+        recording.exchanges = [json.loads(line) for line in tcp_path.read_text(encoding="utf-8").splitlines()]
+    for exchange in recording.exchanges:
+        for turn in recording.turns:
+            if turn.started <= exchange["time"] <= turn.ended:
+                turn.ue_commands += 1
+                break
+    return recording
+
+
+class ReplayLlm(BaseLlm):
+    """Returns one agent's recorded model responses in order.
+
+    A call whose instruction, tool declarations, generation settings or
+    history length differ from the recording is still answered from the
+    recording but counted in ``divergences``, since it means the code under
+    test built a different request. With
+    ``realtime`` the recorded response timing is reproduced; otherwise
+    responses are returned immediately.
+    """
+
+    model: str = "replay"
+    calls: list[dict] = []
+    realtime: bool = False
+    position: int = 0
+    divergences: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if self.position >= len(self.calls):
+            yield LlmResponse(error_code="REPLAY_EXHAUSTED", error_message="No more recorded model calls")
+            return
+        call = self.calls[self.position]
+        self.position += 1
+        if _request_differs(call["request"], _request_json(llm_request)):
+            self.divergences += 1
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for item in call["responses"]:
+            response = LlmResponse.model_validate_json(json.dumps(item["response"]))
+            if response.partial and not stream:
+                continue
+            if self.realtime:
+                await asyncio.sleep(max(0.0, start + item["at"] - loop.time()))
+            yield response
+
+
+class ReplayPlugin(BasePlugin):
+    """Answers non-MCP, non-local tool calls (e.g. image generation) from a recording."""
+
+    def __init__(self, tools: list[dict], name: str = "replay"):
+        super().__init__(name)
+        self._results: dict[str, list[dict]] = {}
+        for record in tools:
+            self._results.setdefault(record["name"], []).append(record["response"])
+
+    async def before_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext
+    ) -> dict | None:
+        if not _is_recorded_tool(tool):
+            return None
+        results = self._results.get(tool.name)
+        if not results:
+            return {"error": f"No recorded result for {tool.name}"}
+        return results.pop(0)
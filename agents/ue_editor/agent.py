@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -10,40 +11,44 @@ from google.adk.tools.mcp_tool import McpToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
 from mcp import StdioServerParameters
 
-_server_path = str(Path(__file__).resolve().parents[2] / "mcp_server" / "server.py")
+from agents.ue_editor.tool_selection import SelectiveToolset
+
+_project_root = str(Path(__file__).resolve().parents[2])
 
 ue_editor_toolset = McpToolset(
     connection_params=StdioConnectionParams(
         server_params=StdioServerParameters(
             command=sys.executable,
-            args=[_server_path],
+            args=["-m", "mcp_server.server"],
+            cwd=_project_root,
+            # The MCP SDK passes only a minimal environment to the server;
+            # forward UE connection settings so they can be set per process.
+            env={key: value for key, value in os.environ.items() if key.startswith("UE_")},
         ),
         timeout=30.0,
     ),
 )
 
+# Only the tools relevant to the current request are declared to the model
+ue_editor_tools = SelectiveToolset(ue_editor_toolset)
+
 ue_editor_agent = LlmAgent(
     model="gemini-3-flash-preview",
     name="ue_editor",
+    # Tool descriptions reach the model with each tool's declaration, so the
+    # instruction only carries guidance on how to combine them.
     instruction=(
         "You are the Unreal Engine Editor agent. You use MCP tools to manipulate "
         "actors in a live UE scene. When asked to add, move, delete, or query objects, "
-        "call the appropriate tool:\n"
-        "- spawn_actor: Spawn a new actor (StaticMeshActor, PointLight, SpotLight, "
-        "DirectionalLight, CameraActor, PlayerStart) at a position.\n"
-        "- get_scene_info: Query all actors in the current scene.\n"
-        "- delete_actor: Remove an actor by its ID.\n"
-        "- set_transform: Move, rotate, or scale an actor (partial updates supported).\n"
-        "- import_asset: Import a file from disk into the UE project as an asset.\n"
-        "- apply_material: Apply a texture as a material to an actor's mesh.\n"
-        "- search_actors: Search for actors by name or class substring match.\n"
-        "- set_visibility: Show or hide an actor (visible=true shows, visible=false hides).\n"
-        "- set_light_intensity: Set a light's brightness (1.0 = default, 0.5 = 50%, 5.0 = 500%). "
-        "Works with PointLight, SpotLight, DirectionalLight, and SkyLight.\n\n"
+        "call the appropriate tool.\n\n"
+        "When placing more than a few actors of the same type, always use a place_* tool "
+        "instead of repeated spawn_actor calls.\n\n"
         "When an actor is referenced ambiguously (e.g. 'the cube', 'a light'), "
         "use search_actors first to resolve the reference to an exact actor ID "
         "before calling other tools like delete_actor or set_transform.\n\n"
-        "Report results clearly and concisely."        
+        "Report results clearly and concisely."
     ),
-    tools=[ue_editor_toolset],
+    tools=[ue_editor_tools],
+    # Recovers when the model calls a tool that selection left out
+    on_tool_error_callback=ue_editor_tools.on_tool_error,
 )
@@ -0,0 +1,223 @@
+"""Expose only the MCP tools relevant to the current request.
+
+Every tool declaration is sent to the model on every call, so the prompt
+grows with the toolset. ``SelectiveToolset`` wraps a toolset and, per turn,
+keeps the tools whose name or docstring shares keywords with the user's
+message. The selection is fixed for the whole turn, so multi-step requests
+see the same tools on every model call.
+
+The heuristic is deliberately conservative: lookup tools are always exposed
+(to resolve references like "the cube"), and a message that matches no other
+tool gets the full set. If the model still calls a tool that was left out,
+``SelectiveToolset.on_tool_error`` declares the full set for the rest of the
+turn and asks the model to call it again.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import Counter, deque
+from typing import Any
+
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools import BaseTool, ToolContext
+from google.adk.tools.base_toolset import BaseToolset
+
+# Exposed whenever selection narrows the set
+ALWAYS_EXPOSED = ("search_actors", "get_scene_info")
+
+# User vocabulary mapped onto the words the tool docstrings use
+SYNONYMS = {
+    "add": ["spawn"],
+    "create": ["spawn"],
+    "put": ["spawn"],
+    "remove": ["delete"],
+    "destroy": ["delete"],
+    "clear": ["delete"],
+    "move": ["position", "transform"],
+    "rotate": ["rotation", "transform"],
+    "turn": ["rotation", "transform"],
+    "scale": ["scale", "transform"],
+    "resize": ["scale", "transform"],
+    "big": ["scale", "transform"],
+    "bigger": ["scale", "transform"],
+    "large": ["scale", "transform"],
+    "larger": ["scale", "transform"],
+    "small": ["scale", "transform"],
+    "smaller": ["scale", "transform"],
+    "hide": ["hide", "visibility"],
+    "show": ["show", "visibility"],
+    "invisible": ["hide", "visibility"],
+    "visible": ["show", "visibility"],
+    "bright": ["brightness", "intensity"],
+    "brighter": ["brightness", "intensity"],
+    "dim": ["brightness", "intensity"],
+    "dimmer": ["brightness", "intensity"],
+    "texture": ["texture", "material", "import"],
+    "image": ["image", "import"],
+    "list": ["scene", "query"],
+    "find": ["search"],
+    "which": ["search"],
+    "where": ["search"],
+    "many": ["place", "count"],
+    "row": ["grid"],
+    "rows": ["grid"],
+    "forest": ["scatter"],
+    "random": ["scatter"],
+    "randomly": ["scatter"],
+    "ring": ["circle"],
+    "around": ["circle"],
+    "line": ["path"],
+    "along": ["path"],
+    "road": ["path"],
+    "fence": ["path"],
+}
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "e", "each", "for", "from",
+    "g", "in", "into", "is", "it", "its", "of", "on", "one", "or", "the", "this",
+    "to", "true", "false", "use", "with", "json", "object", "result", "returns",
+    "args", "none", "default", "ue", "unreal", "engine",
+}
+
+_SECTIONS = re.compile(r"^\s*(?:Args|Returns):", re.MULTILINE)
+_WORD = re.compile(r"[a-z]+")
+# Split CamelCase class names such as PointLight into point, light
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+def keywords(text: str) -> list[str]:
+    """Lowercase word stems in ``text``, minus stopwords."""
+    words = _WORD.findall(_CAMEL.sub(" ", text).lower())
+    return [_stem(word) for word in words if word not in _STOPWORDS and len(word) > 1]
+
+
+def _stem(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class ToolSelector:
+    """Scores tools against a message by keyword overlap with their docstrings.
+
+    A tool's keywords come from its name (weighted highest), the first line
+    of its description, and the prose that follows it. The ``Args:`` and
+    ``Returns:`` sections are skipped: parameter docs repeat generic words
+    ("position", "point", "path") that would match nearly every request.
+    Description words shared by a third or more of the tools (e.g. "actor",
+    "spawn" in every ``place_*`` tool) carry no signal and are dropped.
+    """
+
+    def __init__(self, always_exposed=ALWAYS_EXPOSED, synonyms=SYNONYMS):
+        self.always_exposed = set(always_exposed)
+        self.synonyms = {_stem(word): [_stem(s) for s in targets] for word, targets in synonyms.items()}
+        self._index_key: tuple | None = None
+        self._index: dict[str, Counter] = {}
+
+    def select(self, tools: list[BaseTool], message: str) -> list[BaseTool]:
+        """Return the tools relevant to ``message``, or all of them if none match.
+
+        Matching only an always-exposed tool doesn't count: their descriptions
+        share words with most requests ("the cube", "scene"), so such a
+        message has not said which other tool it needs.
+        """
+        index = self._tool_index(tools)
+        query = set(keywords(message))
+        for word in list(query):
+            query.update(self.synonyms.get(word, ()))
+
+        scores = {name: sum(weights[word] for word in query) for name, weights in index.items()}
+        if not any(score for name, score in scores.items() if name not in self.always_exposed):
+            return tools
+        return [tool for tool in tools if scores[tool.name] > 0 or tool.name in self.always_exposed]
+
+    def _tool_index(self, tools: list[BaseTool]) -> dict[str, Counter]:
+        key = tuple((tool.name, tool.description) for tool in tools)
+        if key == self._index_key:
+            return self._index
+
+        index = {}
+        for tool in tools:
+            summary, _, body = (tool.description or "").partition("\n")
+            body = _SECTIONS.split(body)[0]
+            weights = Counter()
+            for word in keywords(summary):
+                weights[word] = 2
+            for word in keywords(body):
+                weights[word] = max(weights[word], 1)
+            index[tool.name] = weights
+
+        # Drop description words shared by many tools; they can't discriminate
+        frequency = Counter(word for weights in index.values() for word in weights)
+        common = {word for word, n in frequency.items() if n >= len(index) / 3}
+        for tool in tools:
+            weights = index[tool.name]
+            for word in common:
+                weights.pop(word, None)
+            for word in keywords(tool.name.replace("_", " ")):
+                weights[word] = 3
+
+        self._index_key, self._index = key, index
+        return index
+
+
+class SelectiveToolset(BaseToolset):
+    """Wraps a toolset so each turn only sees the tools relevant to it.
+
+    Selection is on unless ``enabled`` is False or, when ``enabled`` is None,
+    the ``AGENT_TOOL_SELECTION`` environment variable is ``0``. Pass
+    ``on_tool_error`` as the agent's ``on_tool_error_callback``: without it,
+    a call to a tool that was not declared ends the turn with an exception.
+    """
+
+    def __init__(self, toolset: BaseToolset, selector: ToolSelector | None = None, enabled: bool | None = None):
+        super().__init__()
+        self.toolset = toolset
+        self.selector = selector or ToolSelector()
+        self.enabled = enabled
+        # Invocations that called a tool selection left out; they see every tool
+        self._unrestricted: deque[str] = deque(maxlen=256)
+
+    @property
+    def selection_enabled(self) -> bool:
+        if self.enabled is not None:
+            return self.enabled
+        return os.getenv("AGENT_TOOL_SELECTION", "1") != "0"
+
+    async def get_tools(self, readonly_context: ReadonlyContext | None = None) -> list[BaseTool]:
+        tools = await self.toolset.get_tools_with_prefix(readonly_context)
+        if (
+            not self.selection_enabled
+            or readonly_context is None
+            or readonly_context.invocation_id in self._unrestricted
+        ):
+            return tools
+        message = _user_text(readonly_context)
+        return self.selector.select(tools, message) if message else tools
+
+    async def on_tool_error(
+        self, tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, error: Exception
+    ) -> dict | None:
+        """Answer a call to a tool that was not declared, instead of failing the turn."""
+        if not isinstance(error, ValueError) or not str(error).startswith(f"Tool '{tool.name}' not found"):
+            return None
+        tools = await self.toolset.get_tools_with_prefix(tool_context)
+        if tool.name not in {candidate.name for candidate in tools}:
+            return {"success": False, "error": f"There is no tool named {tool.name}"}
+        self._unrestricted.append(tool_context.invocation_id)
+        return {
+            "success": False,
+            "error": f"{tool.name} was not available for this request; it is now, so call it again",
+        }
+
+    async def close(self) -> None:
+        await self.toolset.close()
+
+
+def _user_text(readonly_context: ReadonlyContext) -> str:
+    content = readonly_context.user_content
+    if content is None or not content.parts:
+        return ""
+    return " ".join(part.text for part in content.parts if part.text)
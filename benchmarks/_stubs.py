@@ -0,0 +1,72 @@
+"""Stub model and agent wiring shared by the benchmarks.
+
+The benchmarks run the real agent tree and MCP server against the stand-in
+UE plugin in ``mcp_server.fake_ue``, with every model replaced by
+``ScriptedLlm``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from types import ModuleType
+from typing import AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+
+class ScriptedLlm(BaseLlm):
+    """Routes to ue_editor, calls the expected tool if it is declared, then answers.
+
+    ``missed`` is set when ue_editor was not offered the expected tool.
+    """
+
+    model: str = "scripted"
+    delay: float = 0.0
+    expected: tuple[str, dict] = ("get_scene_info", {})
+    missed: bool = False
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        tool, args = self.expected
+        last = llm_request.contents[-1]
+        if any(part.function_response for part in last.parts or []):
+            part = types.Part(text="Done.")
+        elif "transfer_to_agent" in llm_request.tools_dict and "get_scene_info" not in llm_request.tools_dict:
+            part = types.Part(function_call=types.FunctionCall(
+                name="transfer_to_agent", args={"agent_name": "ue_editor"},
+            ))
+        elif tool in llm_request.tools_dict:
+            part = types.Part(function_call=types.FunctionCall(name=tool, args=args))
+        else:
+            self.missed = True
+            part = types.Part(text=f"I can't do that without {tool}.")
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+def use_model(agent, model: BaseLlm) -> None:
+    """Give ``agent`` and all its sub-agents ``model``."""
+    agent.model = model
+    for sub_agent in agent.sub_agents:
+        use_model(sub_agent, model)
+
+
+def load_agents(ue_port: int) -> tuple[LlmAgent, ModuleType]:
+    """Import the agent tree with its MCP server pointed at a stand-in plugin.
+
+    Returns the orchestrator agent and the ``agents.ue_editor.agent`` module.
+    The MCP subprocess inherits UE_* settings when the toolset is built, so
+    this must run before anything else imports the agents.
+    """
+    os.environ["UE_TCP_PORT"] = str(ue_port)
+    # Benchmark runs are never part of a session recording
+    os.environ["UE_TCP_RECORD"] = ""
+    from agents.orchestrator.agent import orchestrator_agent
+    from agents.ue_editor import agent as ue_editor
+
+    return orchestrator_agent, ue_editor
@@ -0,0 +1,105 @@
+"""Encode/decode time and wire size of each codec for large scene payloads.
+
+Run from the project root::
+
+    python -m benchmarks.codec --actors 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pydantic_core
+
+from mcp_server import codec, placement
+
+
+def _scene_response(actors: int) -> dict:
+    """A get_scene_info response shaped like the plugin's."""
+    rng = np.random.default_rng(0)
+    values = np.round(rng.uniform(-10000.0, 10000.0, (actors, 9)), 2).tolist()
+    return {
+        "success": True,
+        "actors": [
+            {
+                "actor_id": f"StaticMeshActor_{i}",
+                "class": "StaticMeshActor",
+                "transform": {
+                    "location": {"x": v[0], "y": v[1], "z": v[2]},
+                    "rotation": {"pitch": v[3], "yaw": v[4], "roll": v[5]},
+                    "scale": {"x": v[6], "y": v[7], "z": v[8]},
+                },
+            }
+            for i, v in enumerate(values)
+        ],
+    }
+
+
+def _spawn_request(actors: int) -> dict:
+    locations = placement.scatter(actors, (0.0, 0.0, 0.0), 50000.0, 50000.0, seed=0)
+    transforms = placement.make_transforms(locations, yaw_jitter=180.0, scale_min=0.5, scale_max=2.0, seed=0)
+    return {
+        "command": "spawn_actors",
+        "params": {"actor_type": "StaticMeshActor", "transforms": np.round(transforms, 3)},
+    }
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _bench_codecs(label: str, message: dict, repeat: int) -> None:
+    print(f"\n{label}")
+    print(f"  {'codec':<16}{'bytes':>12}{'encode ms':>12}{'decode ms':>12}")
+    wires = [("json (stdlib)", codec.JsonCodec())]
+    if codec.orjson is not None:
+        wires.append(("json (orjson)", codec.OrjsonCodec()))
+    if codec.msgpack is not None:
+        wires.append(("msgpack", codec.MsgpackCodec()))
+
+    for name, wire in wires:
+        frame = wire.encode(message)
+        body = frame[4:] if wire.name == "msgpack" else frame
+        encode_ms = _time(lambda: wire.encode(message), repeat)
+        decode_ms = _time(lambda: wire.decode(body), repeat)
+        print(f"  {name:<16}{len(frame):>12,}{encode_ms:>12.2f}{decode_ms:>12.2f}")
+
+
+def _bench_tool_layer(response: dict, repeat: int) -> None:
+    """Old tools parsed the response then json.dumps'd it again for FastMCP."""
+    line = codec.JsonCodec().encode(response)
+    wire = codec.get_codec("json")
+
+    def old() -> None:
+        json.dumps(json.loads(line))
+
+    def new() -> None:
+        pydantic_core.to_json(wire.decode(line))
+
+    print("\nTool layer, get_scene_info response -> MCP text content")
+    print(f"  decode + json.dumps (old)       {_time(old, repeat):8.2f} ms")
+    print(f"  decode + single serialise (new) {_time(new, repeat):8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actors", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _bench_codecs(f"spawn_actors request, {args.actors} transforms", _spawn_request(args.actors), args.repeat)
+    response = _scene_response(args.actors)
+    _bench_codecs(f"get_scene_info response, {args.actors} actors", response, args.repeat)
+    _bench_tool_layer(response, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
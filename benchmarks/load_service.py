@@ -0,0 +1,113 @@
+"""Load test the multi-session service with stub model and UE backends.
+
+Starts the stand-in UE plugin, points the MCP server subprocess at it, swaps
+every agent's model for a scripted stub with a fixed think time, serves the
+real agent tree over HTTP and drives it with concurrent sessions. Each turn
+transfers to ue_editor (first turn only), calls get_scene_info through MCP
+and replies. Run from the project root::
+
+    python -m benchmarks.load_service --sessions 32 --turns 5 --max-turns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import time
+
+import httpx
+import uvicorn
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from benchmarks._stubs import ScriptedLlm, load_agents, use_model
+from mcp_server.fake_ue import FakeUEServer, FaultConfig
+from service.app import AgentService, create_app
+from service.scheduler import FairScheduler
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _session(client: httpx.AsyncClient, turns: int, latencies: list, first_events: list) -> None:
+    session_id = (await client.post("/sessions", json={})).json()["session_id"]
+    for i in range(turns):
+        start = time.perf_counter()
+        first = None
+        async with client.stream("POST", f"/sessions/{session_id}/turns", json={"message": f"turn {i}"}) as response:
+            async for line in response.aiter_lines():
+                if first is None:
+                    first = time.perf_counter() - start
+                if json.loads(line).get("error"):
+                    raise RuntimeError(line)
+        latencies.append(time.perf_counter() - start)
+        first_events.append(first)
+
+
+def _pct(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+
+async def _run(args: argparse.Namespace) -> None:
+    async with FakeUEServer(faults=FaultConfig(latency=args.ue_latency)) as fake:
+        orchestrator_agent, _ = load_agents(fake.port)
+        use_model(orchestrator_agent, ScriptedLlm(delay=args.model_latency))
+        runner = Runner(
+            app_name="load_service",
+            agent=orchestrator_agent,
+            session_service=InMemorySessionService(),
+        )
+        service = AgentService(runner, FairScheduler(args.max_turns))
+
+        port = _free_port()
+        server = uvicorn.Server(uvicorn.Config(create_app(service), port=port, log_level="warning"))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        latencies: list[float] = []
+        first_events: list[float] = []
+        limits = httpx.Limits(max_connections=args.sessions)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=120, limits=limits) as client:
+            # Warm up the MCP subprocess and codec negotiation
+            await _session(client, 1, [], [])
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                _session(client, args.turns, latencies, first_events) for _ in range(args.sessions)
+            ))
+            elapsed = time.perf_counter() - start
+
+        server.should_exit = True
+        await serving
+
+    print(
+        f"{args.sessions} sessions x {args.turns} turns, max_turns={args.max_turns}, "
+        f"model={args.model_latency * 1000:.0f}ms/call, ue={args.ue_latency * 1000:.0f}ms/command"
+    )
+    print(f"  throughput   {len(latencies) / elapsed:8.1f} turns/s  ({elapsed:.2f}s total)")
+    print(f"  turn         p50={_pct(latencies, 0.5):8.1f}ms  p95={_pct(latencies, 0.95):8.1f}ms  "
+          f"p99={_pct(latencies, 0.99):8.1f}ms")
+    print(f"  first event  p50={_pct(first_events, 0.5):8.1f}ms  p95={_pct(first_events, 0.95):8.1f}ms  "
+          f"p99={_pct(first_events, 0.99):8.1f}ms")
+    print(f"  UE commands  {len(fake.commands)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--max-turns", type=int, default=8)
+    parser.add_argument("--model-latency", type=float, default=0.05)
+    parser.add_argument("--ue-latency", type=float, default=0.005)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
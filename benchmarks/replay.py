@@ -0,0 +1,105 @@
+"""Replay a recorded REPL session offline and report per-turn timings.
+
+Record a session with ``python main.py --record recordings/demo``, then::
+
+    python -m benchmarks.replay recordings/demo [--realtime] [--show-output]
+
+Model outputs, and results of non-MCP tools such as image generation, come
+from the recording. UE commands go through the real MCP server to a stand-in
+plugin that answers with the recorded responses. Replays therefore need no
+network, API key or Unreal Editor. Without ``--realtime`` the recorded model
+latency is skipped, so turn times measure the agent framework, MCP server
+and TCP path alone.
+
+Exits with status 1 if any turn's model calls or UE commands differ from the
+recording.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import sys
+
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.apps import App
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from agents.prompt_stats import PromptStatsPlugin
+from agents.recording import Recording, ReplayLlm, ReplayPlugin, load_recording
+from benchmarks._stubs import load_agents
+from main import APP_NAME, USER_ID, TurnPrinter, run_turn
+from mcp_server.fake_ue import ReplayUEServer
+
+
+def _install_replay_models(agent, recording: Recording, realtime: bool, models: dict) -> None:
+    calls = [call for call in recording.llm_calls if call["agent"] == agent.name]
+    agent.model = models[agent.name] = ReplayLlm(calls=calls, realtime=realtime)
+    for sub_agent in agent.sub_agents:
+        _install_replay_models(sub_agent, recording, realtime, models)
+
+
+async def _replay(args: argparse.Namespace) -> int:
+    recording = load_recording(args.recording)
+
+    async with ReplayUEServer(recording.exchanges) as fake:
+        orchestrator_agent, ue_editor = load_agents(fake.port)
+
+        models: dict[str, ReplayLlm] = {}
+        _install_replay_models(orchestrator_agent, recording, args.realtime, models)
+        stats = PromptStatsPlugin()
+        runner = Runner(
+            app=App(name=APP_NAME, root_agent=orchestrator_agent, plugins=[stats, ReplayPlugin(recording.tools)]),
+            session_service=InMemorySessionService(),
+        )
+        session = await runner.session_service.create_session(app_name=APP_NAME, user_id=USER_ID)
+        printer = TurnPrinter(sys.stdout if args.show_output else io.StringIO())
+        streaming = StreamingMode.SSE if recording.streaming else StreamingMode.NONE
+
+        rows = []
+        try:
+            for turn in recording.turns:
+                if args.show_output:
+                    print(f"> {turn.input}")
+                commands, invocations = len(fake.commands), set(stats.turns)
+                timing = await run_turn(runner, session.id, turn.input, printer, RunConfig(streaming_mode=streaming))
+                model_calls = sum(stats.turns[i].model_calls for i in stats.turns.keys() - invocations)
+                rows.append((turn, timing, model_calls, len(fake.commands) - commands))
+        finally:
+            await ue_editor.ue_editor_toolset.close()
+
+    print(f"{'turn':>4}  {'input':<36}{'recorded':>10}{'replay':>9}{'first out':>11}{'model calls':>13}{'UE cmds':>9}")
+    mismatched = 0
+    for i, (turn, timing, model_calls, ue_commands) in enumerate(rows, 1):
+        differs = model_calls != turn.model_calls or ue_commands != turn.ue_commands
+        mismatched += differs
+        first_output = f"{timing.first_output:.3f}s" if timing.first_output is not None else "-"
+        print(
+            f"{i:>4}  {turn.input[:35]:<36}{turn.elapsed:>9.2f}s{timing.total:>8.3f}s{first_output:>11}"
+            f"{model_calls:>8}/{turn.model_calls:<4}{ue_commands:>5}/{turn.ue_commands:<3}"
+            f"{'  MISMATCH' if differs else ''}"
+        )
+    replay_total = sum(timing.total for _, timing, _, _ in rows)
+    recorded_total = sum(turn.elapsed for turn in recording.turns)
+    divergences = sum(model.divergences for model in models.values())
+    print(
+        f"\n{len(rows)} turns in {replay_total:.2f}s (recorded {recorded_total:.2f}s); "
+        f"{divergences} model requests differ from the recording; "
+        f"{fake.unmatched} UE commands had no recorded response; "
+        f"{mismatched} turns with different call counts"
+    )
+    return 1 if mismatched else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="directory written by main.py --record")
+    parser.add_argument("--realtime", action="store_true", help="reproduce recorded model response timing")
+    parser.add_argument("--show-output", action="store_true", help="print the replayed turns")
+    sys.exit(asyncio.run(_replay(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Tail latency of send_command against the fault-injecting stand-in plugin.
+
+Compares the default deadlines and circuit breaker with effectively unbounded
+waits (the old behaviour). Each mode issues calls one after another, pausing
+``--interval`` between them, for ``--duration`` seconds, so the breaker sees
+quiet spells and its recovery is exercised. Calls the breaker rejects without
+contacting the plugin are counted separately and left out of the
+percentiles. Run from the project root::
+
+    python -m benchmarks.tail_latency --duration 20 --stall-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from unittest.mock import patch
+
+from mcp_server import server
+from mcp_server.circuit_breaker import CircuitBreaker
+from mcp_server.fake_ue import FakeUEServer, FaultConfig
+
+OUTCOMES = ("ok", "timeout", "error", "fast_fail")
+
+
+def _outcome(result: dict) -> str:
+    if result.get("success"):
+        return "ok"
+    error = result.get("error", "")
+    if error.startswith("Timed out"):
+        return "timeout"
+    if "unreachable" in error:
+        return "fast_fail"
+    return "error"
+
+
+async def _run(args: argparse.Namespace, timeout: float, breaker: CircuitBreaker) -> list[tuple[str, float]]:
+    faults = FaultConfig(
+        latency=args.latency,
+        stall_rate=args.stall_rate,
+        stall_seconds=args.stall_seconds,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    calls = []
+    async with FakeUEServer(faults=faults) as fake:
+        with patch.object(server, "UE_TCP_PORT", fake.port), patch.object(server, "breaker", breaker):
+            end = time.perf_counter() + args.duration
+            while time.perf_counter() < end:
+                start = time.perf_counter()
+                result = await server.send_command("get_scene_info", timeout=timeout)
+                calls.append((_outcome(result), time.perf_counter() - start))
+                await asyncio.sleep(args.interval)
+    return calls
+
+
+def _report(label: str, calls: list[tuple[str, float]]) -> None:
+    counts = Counter(outcome for outcome, _ in calls)
+    # Fast fails never reach the plugin; their latency says nothing about it
+    ordered = sorted(latency for outcome, latency in calls if outcome != "fast_fail")
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    print(f"{label:<12}" + "  ".join(f"{outcome}={counts[outcome]:<4}" for outcome in OUTCOMES))
+    if ordered:
+        print(
+            f"{'':<12}reached plugin: p50={pct(0.50):8.1f}ms  p95={pct(0.95):8.1f}ms  "
+            f"p99={pct(0.99):8.1f}ms  max={ordered[-1] * 1000:8.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per mode")
+    parser.add_argument("--interval", type=float, default=0.05, help="pause between calls")
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--stall-rate", type=float, default=0.05)
+    parser.add_argument("--stall-seconds", type=float, default=2.0)
+    parser.add_argument("--drop-rate", type=float, default=0.05)
+    parser.add_argument("--deadline", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    unbounded = asyncio.run(_run(args, timeout=3600.0, breaker=CircuitBreaker(10**9, 0.0)))
+    bounded = asyncio.run(_run(args, timeout=args.deadline, breaker=CircuitBreaker(3, 1.0)))
+
+    print(
+        f"get_scene_info every {args.interval * 1000:.0f}ms for {args.duration:.0f}s, "
+        f"stall_rate={args.stall_rate}, drop_rate={args.drop_rate}"
+    )
+    _report("unbounded", unbounded)
+    _report("deadlines", bounded)
+
+
+if __name__ == "__main__":
+    main()
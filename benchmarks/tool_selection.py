@@ -0,0 +1,98 @@
+"""Prompt bytes and model calls per turn with and without tool selection.
+
+Runs a fixed set of requests through the real agent tree, MCP server and
+stand-in UE plugin, with every model replaced by a scripted stub. The stub
+calls the tool a real model would need for each request; if selection has
+hidden that tool the turn is counted as a miss. Run from the project root::
+
+    python -m benchmarks.tool_selection
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from google.adk.apps import App
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from agents.prompt_stats import PromptStatsPlugin
+from benchmarks._stubs import ScriptedLlm, load_agents, use_model
+from mcp_server.fake_ue import FakeUEServer
+
+REQUESTS = [
+    ("Add a point light above the origin", "spawn_actor",
+     {"actor_type": "PointLight", "x": 0, "y": 0, "z": 300}),
+    ("Make the light dimmer", "set_light_intensity", {"actor_id": "PointLight_1", "intensity": 0.5}),
+    ("Hide the cube", "set_visibility", {"actor_id": "StaticMeshActor_1", "visible": False}),
+    ("What's in the scene?", "get_scene_info", {}),
+    ("Move the cube up 100 units", "set_transform", {"actor_id": "StaticMeshActor_1", "z": 100}),
+    ("Delete all the spheres", "delete_actor", {"actor_id": "StaticMeshActor_1"}),
+    ("Plant a forest of 200 trees", "place_scatter",
+     {"actor_type": "StaticMeshActor", "count": 200, "center_x": 0, "center_y": 0, "center_z": 0,
+      "extent_x": 5000, "extent_y": 5000}),
+    ("Put 12 lamps in a ring around the statue", "place_circle",
+     {"actor_type": "PointLight", "count": 12, "center_x": 0, "center_y": 0, "center_z": 0, "radius": 500}),
+    ("Line the road with 40 lamp posts", "place_along_path",
+     {"actor_type": "StaticMeshActor", "count": 40, "path_points": [[0, 0, 0], [4000, 0, 0]]}),
+    ("Apply the brick texture to the wall", "apply_material",
+     {"actor_id": "StaticMeshActor_1", "texture_asset_path": "/Game/Generated/brick"}),
+    ("Do that again, but twice as big", "set_transform", {"actor_id": "StaticMeshActor_1", "scale_x": 2}),
+]
+
+
+async def _run(selection: bool, model: ScriptedLlm, orchestrator_agent, selective_toolset, fake) -> list[tuple]:
+    selective_toolset.enabled = selection
+    fake.reset_scene()
+    stats = PromptStatsPlugin()
+    runner = Runner(
+        app=App(name="tool_selection", root_agent=orchestrator_agent, plugins=[stats]),
+        session_service=InMemorySessionService(),
+    )
+    rows = []
+    for message, tool, args in REQUESTS:
+        model.expected, model.missed = (tool, args), False
+        session = await runner.session_service.create_session(app_name="tool_selection", user_id="bench")
+        content = types.Content(role="user", parts=[types.Part(text=message)])
+        async for event in runner.run_async(user_id="bench", session_id=session.id, new_message=content):
+            turn = stats.turns[event.invocation_id]
+        rows.append((message, turn, model.missed))
+    return rows
+
+
+async def _main(args: argparse.Namespace) -> None:
+    async with FakeUEServer() as fake:
+        orchestrator_agent, ue_editor = load_agents(fake.port)
+        model = ScriptedLlm()
+        use_model(orchestrator_agent, model)
+        try:
+            full = await _run(False, model, orchestrator_agent, ue_editor.ue_editor_tools, fake)
+            selected = await _run(True, model, orchestrator_agent, ue_editor.ue_editor_tools, fake)
+        finally:
+            await ue_editor.ue_editor_toolset.close()
+
+    print(f"{'request':<44}{'calls':>7}{'full KB':>10}{'sel KB':>9}{'tools':>8}  miss")
+    totals = [0, 0, 0]
+    for (message, f, _), (_, s, missed) in zip(full, selected):
+        print(
+            f"{message[:43]:<44}{s.model_calls:>3}/{f.model_calls:<3}{f.prompt_bytes / 1024:>10.1f}"
+            f"{s.prompt_bytes / 1024:>9.1f}{s.max_tools:>4}/{f.max_tools:<3}  {'yes' if missed else ''}"
+        )
+        totals[0] += f.prompt_bytes
+        totals[1] += s.prompt_bytes
+        totals[2] += missed
+    print(
+        f"\nprompt bytes: {totals[0]:,} full, {totals[1]:,} selected "
+        f"({1 - totals[1] / totals[0]:.0%} smaller); {totals[2]} of {len(REQUESTS)} turns missed a tool"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
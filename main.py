@@ -1,24 +1,180 @@
-"""CLI entry point — interactive REPL for the Orchestrator agent."""
+"""CLI entry point — interactive REPL for the Orchestrator agent.
+
+Replies stream to the terminal as the model produces them, and a progress
+line is printed as each tool call starts and finishes. Time to first output
+is recorded for every turn. ``--record DIR`` saves the session (inputs, model
+calls and UE exchanges) for offline replay with ``benchmarks.replay``.
+
+    python main.py [--no-stream] [--timings] [--record DIR]
+"""
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
 
 from dotenv import load_dotenv
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.apps import App
+from google.adk.events import Event
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from agents.orchestrator.agent import orchestrator_agent
-from agents.ue_editor.agent import ue_editor_toolset
-
 APP_NAME = "unreal_agentic_control"
 USER_ID = "local_user"
 
 
-async def main() -> None:
+@dataclass
+class TurnTiming:
+    """Seconds from sending a message until something was shown, and until done."""
+
+    first_output: float | None = None
+    first_text: float | None = None
+    total: float = 0.0
+
+
+class TurnPrinter:
+    """Writes a turn's events to the terminal as they arrive.
+
+    Partial (streamed) text is written as it comes; the complete event that
+    follows repeats it and is not printed again. Tool calls get a line when
+    the model issues them and another when their result comes back.
+    """
+
+    def __init__(self, out: TextIO = sys.stdout, clock=time.perf_counter):
+        self.out = out
+        self.clock = clock
+        self.turns: list[TurnTiming] = []
+        self.start_turn()
+
+    def start_turn(self) -> None:
+        self._start = self.clock()
+        self._timing = TurnTiming()
+        self._mid_line = False
+        self._streamed = False
+        self._calls: dict[str, float] = {}
+
+    def end_turn(self) -> TurnTiming:
+        self._end_line()
+        self._timing.total = self.clock() - self._start
+        self.turns.append(self._timing)
+        return self._timing
+
+    def handle(self, event: Event) -> None:
+        parts = event.content.parts if event.content and event.content.parts else []
+        text = "".join(part.text for part in parts if part.text and not part.thought)
+
+        if event.partial:
+            if text:
+                self._write(text, is_text=True)
+                self._streamed = True
+            return
+
+        if self._streamed:
+            self._end_line()
+        elif text:
+            self._line(text, is_text=True)
+        self._streamed = False
+
+        for call in event.get_function_calls():
+            self._calls[call.id] = self.clock()
+            if call.name == "transfer_to_agent":
+                self._line(f"  -> {(call.args or {}).get('agent_name')}")
+            else:
+                self._line(f"  ... {_describe_call(call)}")
+
+        for response in event.get_function_responses():
+            started = self._calls.pop(response.id, None)
+            if response.name == "transfer_to_agent":
+                continue
+            elapsed = f" ({self.clock() - started:.2f}s)" if started is not None else ""
+            error = _tool_error(response.response or {})
+            if error:
+                self._line(f"  err {response.name}{elapsed}: {error}")
+            else:
+                self._line(f"  ok  {response.name}{elapsed}")
+
+    def _line(self, line: str, is_text: bool = False) -> None:
+        self._end_line()
+        self._write(line + "\n", is_text)
+
+    def _end_line(self) -> None:
+        if self._mid_line:
+            self._write("\n")
+
+    def _write(self, text: str, is_text: bool = False) -> None:
+        elapsed = self.clock() - self._start
+        if self._timing.first_output is None:
+            self._timing.first_output = elapsed
+        if is_text and self._timing.first_text is None:
+            self._timing.first_text = elapsed
+        self.out.write(text)
+        self.out.flush()
+        self._mid_line = not text.endswith("\n")
+
+
+def _describe_call(call: types.FunctionCall, limit: int = 100) -> str:
+    args = ", ".join(f"{key}={value!r}" for key, value in (call.args or {}).items())
+    description = f"{call.name}({args})"
+    return description if len(description) <= limit else description[:limit - 4] + "...)"
+
+
+def _tool_error(response: dict) -> str | None:
+    """The error reported by a tool response, if it failed."""
+    # MCP tools return a CallToolResult; our tools' JSON is the structured content
+    result = response.get("structuredContent") or response
+    if result.get("error"):
+        return str(result["error"])
+    if response.get("isError") or result.get("success") is False:
+        # Exceptions raised in an MCP tool arrive as text content
+        text = " ".join(item.get("text", "") for item in response.get("content") or [] if isinstance(item, dict))
+        return text.strip() or "failed"
+    return None
+
+
+async def run_turn(
+    runner: Runner,
+    session_id: str,
+    message: str,
+    printer: TurnPrinter,
+    run_config: RunConfig | None = None,
+) -> TurnTiming:
+    """Run one turn, printing its events as they arrive."""
+    content = types.Content(role="user", parts=[types.Part(text=message)])
+    printer.start_turn()
+    async for event in runner.run_async(
+        session_id=session_id,
+        user_id=USER_ID,
+        new_message=content,
+        run_config=run_config,
+    ):
+        printer.handle(event)
+    return printer.end_turn()
+
+
+async def main(stream: bool = True, show_timings: bool = False, record: str | None = None) -> None:
     load_dotenv()
 
+    plugins = []
+    if record:
+        from agents.recording import TCP_FILE, SessionRecorder
+
+        plugins.append(SessionRecorder(record, streaming=stream))
+        # Read by the MCP server subprocess, which inherits UE_* settings
+        os.environ["UE_TCP_RECORD"] = str(Path(record, TCP_FILE).resolve())
+
+    # Imported here so the MCP server's environment is complete when the
+    # toolset is built
+    from agents.orchestrator.agent import orchestrator_agent
+    from agents.ue_editor.agent import ue_editor_toolset
+
     session_service = InMemorySessionService()
     session = await session_service.create_session(
         app_name=APP_NAME,
@@ -26,10 +182,11 @@ async def main() -> None:
     )
 
     runner = Runner(
-        app_name=APP_NAME,
-        agent=orchestrator_agent,
+        app=App(name=APP_NAME, root_agent=orchestrator_agent, plugins=plugins),
         session_service=session_service,
     )
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE)
+    printer = TurnPrinter()
 
     print("Unreal Engine Agentic Control")
     print("Type your request (exit/quit to stop)\n")
@@ -43,20 +200,16 @@ async def main() -> None:
             if user_input.lower() in ("exit", "quit", "/quit"):
                 break
 
-            content = types.Content(
-                role="user",
-                parts=[types.Part(text=user_input)],
-            )
-
-            async for event in runner.run_async(
-                session_id=session.id,
-                user_id=USER_ID,
-                new_message=content,
-            ):
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            print(part.text)
+            try:
+                timing = await run_turn(runner, session.id, user_input, printer, run_config)
+            except Exception as exc:
+                printer.end_turn()
+                print(f"  error: {type(exc).__name__}: {exc}")
+                continue
+            if show_timings:
+                first_text = f"{timing.first_text:.2f}s" if timing.first_text is not None else "-"
+                first_output = f"{timing.first_output:.2f}s" if timing.first_output is not None else "-"
+                print(f"  [first output {first_output}, first text {first_text}, turn {timing.total:.2f}s]")
     except KeyboardInterrupt:
         print("\nShutting down.")
     finally:
@@ -65,4 +218,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Unreal Engine Agentic Control REPL")
+    parser.add_argument("--no-stream", action="store_true", help="print replies only once complete")
+    parser.add_argument("--timings", action="store_true", help="show time to first output after each turn")
+    parser.add_argument("--record", metavar="DIR", help="record the session for benchmarks.replay")
+    args = parser.parse_args()
+    asyncio.run(main(stream=not args.no_stream, show_timings=args.timings, record=args.record))
@@ -0,0 +1,66 @@
+"""Circuit breaker that fails fast while the UE plugin is unreachable."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class CircuitBreaker:
+    """Track consecutive transport failures and short-circuit calls.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    ``allow()`` returns False for ``reset_timeout`` seconds. The first call
+    after that is let through as a trial (half-open): success closes the
+    breaker, failure re-opens it. Other callers keep failing fast while the
+    trial is in flight; if the trial never reports back (e.g. it was
+    cancelled) another one is allowed after a further ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """One of ``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed."""
+        state = self.state
+        if state == "half_open":
+            # Re-arm the timer so concurrent callers fail fast during the trial
+            self._opened_at = self._clock()
+            return True
+        return state == "closed"
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed (0 when closed)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+    def reset(self) -> None:
+        self.record_success()
@@ -0,0 +1,186 @@
+"""Wire codecs for the UE TCP protocol.
+
+Two framings share the connection, told apart by the first byte of each
+message:
+
+- ``json``: newline-delimited JSON (always starts with ``{``). Understood by
+  every plugin version and used as the fallback. Encoded with orjson when it
+  is installed, otherwise the standard library.
+- ``msgpack``: a 4-byte big-endian length followed by a MessagePack body.
+  Frames are capped at 16 MiB so the first byte is always ``0x00``. NumPy
+  float arrays (e.g. ``spawn_actors`` transforms) travel as binary extension
+  types instead of text floats: 2-D arrays already rounded to 3 decimals
+  (as ``spawn_transforms`` sends them) as int32 fixed-point, 4 bytes per
+  value with no loss, and anything else as float64.
+
+The codec is chosen once per process with the ``negotiate_codec`` command;
+plugins that don't know the command answer "Unknown command" and the client
+stays on ``json``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speed-up
+    msgpack = None
+
+MAX_FRAME_SIZE = 0xFFFFFF
+
+# MessagePack extension type for a float64 array: ndim byte, uint32 dims,
+# then little-endian float64 data.
+FLOAT_ARRAY_EXT = 1
+
+# Extension type for a 2-D float array on a 1e-3 grid: uint32 rows and
+# columns, one little-endian int64 offset per column, then int32 values.
+# Value = (offset + int32) / 1000. Offsets from each column's minimum keep
+# large-world coordinates exact as long as a column spans less than ~2,147 km
+# (in UE units of cm, ~21 km); wider arrays fall back to float64. Float32
+# would lose sub-unit precision at large-world coordinates.
+FIXED_ARRAY_EXT = 2
+FIXED_POINT_SCALE = 1000
+_INT32_SPAN = 2**32 - 1
+
+
+class CodecError(Exception):
+    """A message could not be encoded, or a reply could not be read or decoded."""
+
+
+class JsonCodec:
+    """Newline-delimited JSON using the standard library."""
+
+    name = "json"
+
+    def encode(self, message: dict) -> bytes:
+        return (json.dumps(message, default=_json_default) + "\n").encode()
+
+    def decode(self, frame: bytes) -> dict:
+        return json.loads(frame)
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        frame = await reader.readline()
+        if not frame:
+            raise ConnectionError("connection closed by peer")
+        return frame
+
+
+class OrjsonCodec(JsonCodec):
+    """Newline-delimited JSON using orjson; identical on the wire to JsonCodec."""
+
+    def encode(self, message: dict) -> bytes:
+        return orjson.dumps(
+            message,
+            default=_json_default,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+    def decode(self, frame: bytes) -> dict:
+        return orjson.loads(frame)
+
+
+class MsgpackCodec:
+    """Length-prefixed MessagePack with binary float arrays."""
+
+    name = "msgpack"
+
+    def encode(self, message: dict) -> bytes:
+        body = msgpack.packb(message, default=_pack_ext)
+        if len(body) > MAX_FRAME_SIZE:
+            raise ValueError(f"message of {len(body)} bytes exceeds the 16 MiB frame limit")
+        return len(body).to_bytes(4, "big") + body
+
+    def decode(self, frame: bytes) -> dict:
+        return msgpack.unpackb(frame, ext_hook=_unpack_ext)
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        try:
+            header = await reader.readexactly(4)
+            return await reader.readexactly(int.from_bytes(header, "big"))
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("connection closed by peer") from exc
+
+
+Codec = JsonCodec | MsgpackCodec
+
+
+def available_codecs() -> list[str]:
+    """Wire codecs this process can speak, most compact first."""
+    return ["msgpack", "json"] if msgpack is not None else ["json"]
+
+
+def get_codec(name: str) -> Codec:
+    """Return the fastest available implementation of a wire codec."""
+    if name == "msgpack":
+        if msgpack is None:
+            raise ValueError("msgpack codec requested but msgpack is not installed")
+        return MsgpackCodec()
+    if name == "json":
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    raise ValueError(f"Unknown codec: {name}")
+
+
+def is_msgpack_frame(first_byte: bytes) -> bool:
+    """True if a message starting with ``first_byte`` is a msgpack frame."""
+    return first_byte == b"\x00"
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _pack_ext(obj):
+    if isinstance(obj, np.ndarray) and np.issubdtype(obj.dtype, np.floating):
+        fixed = _pack_fixed(obj)
+        if fixed is not None:
+            return msgpack.ExtType(FIXED_ARRAY_EXT, fixed)
+        header = struct.pack(f"<B{obj.ndim}I", obj.ndim, *obj.shape)
+        return msgpack.ExtType(FLOAT_ARRAY_EXT, header + obj.astype("<f8").tobytes())
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+def _pack_fixed(obj: np.ndarray) -> bytes | None:
+    """Fixed-point encoding of ``obj``, or None if it would not be lossless."""
+    if obj.ndim != 2 or obj.size == 0 or not np.isfinite(obj).all():
+        return None
+    scaled = np.rint(obj * FIXED_POINT_SCALE)
+    if np.abs(scaled).max() >= 2**53 or not np.array_equal(scaled / FIXED_POINT_SCALE, obj):
+        return None
+    offsets = scaled.min(axis=0)
+    if (scaled.max(axis=0) - offsets).max() > _INT32_SPAN:
+        return None
+    # Shift into the signed range so the full 32-bit span is usable
+    offsets += 2**31
+    values = (scaled - offsets).astype("<i4")
+    return struct.pack("<2I", *obj.shape) + offsets.astype("<i8").tobytes() + values.tobytes()
+
+
+def _unpack_ext(code: int, data: bytes):
+    if code == FIXED_ARRAY_EXT:
+        rows, cols = struct.unpack_from("<2I", data)
+        offsets = np.frombuffer(data, dtype="<i8", count=cols, offset=8)
+        values = np.frombuffer(data, dtype="<i4", offset=8 + 8 * cols).reshape(rows, cols)
+        return (values + offsets) / FIXED_POINT_SCALE
+    if code != FLOAT_ARRAY_EXT:
+        return msgpack.ExtType(code, data)
+    ndim = data[0]
+    shape = struct.unpack_from(f"<{ndim}I", data, 1)
+    return np.frombuffer(data, dtype="<f8", offset=1 + 4 * ndim).reshape(shape)
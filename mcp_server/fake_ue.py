@@ -0,0 +1,325 @@
+"""Stand-in for the UE TCP plugin, with fault injection.
+
+Speaks the same protocol as ``AgenticControlServer`` — newline-delimited
+JSON, plus the length-prefixed msgpack framing from ``mcp_server.codec`` —
+against an in-memory scene, so the MCP server can be exercised without a
+running Unreal Editor. Like the plugin, it serves one client at a time: a
+slow or stalled command holds up every connection queued behind it.
+
+Run standalone with::
+
+    python -m mcp_server.fake_ue --port 9000 --latency 0.01 --stall-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from collections import deque
+from dataclasses import dataclass, field
+
+from mcp_server import codec
+
+
+@dataclass
+class FaultConfig:
+    """Faults applied to each command the stand-in server receives.
+
+    ``script`` is consumed first, one entry per command (``"ok"``, ``"drop"``
+    or ``"stall"``), which makes individual tests deterministic. Once empty,
+    ``drop_rate`` and ``stall_rate`` decide at random.
+    """
+
+    latency: float = 0.0
+    stall_rate: float = 0.0
+    stall_seconds: float = 60.0
+    drop_rate: float = 0.0
+    seed: int | None = None
+    script: deque[str] = field(default_factory=deque)
+
+
+class FakeUEServer:
+    """Async TCP server that mimics the UE plugin's command handling."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: FaultConfig | None = None,
+        codecs: tuple[str, ...] | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultConfig()
+        # Codecs accepted in negotiate_codec; empty behaves like a plugin
+        # that predates negotiation.
+        self.codecs = tuple(codec.available_codecs()) if codecs is None else codecs
+        self.actors: dict[str, dict] = {}
+        self.commands: list[dict] = []
+        self.connections = 0
+        self._rng = random.Random(self.faults.seed)
+        self._client_lock = asyncio.Lock()
+        self._counters: dict[str, int] = {}
+        self._handlers: set[asyncio.Task] = set()
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> FakeUEServer:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Stalled handlers would otherwise keep wait_closed() waiting
+            for handler in self._handlers:
+                handler.cancel()
+            await self._server.wait_closed()
+            self._server = None
+
+    def reset_scene(self) -> None:
+        """Remove all actors and restart actor numbering, like opening a new level."""
+        self.actors.clear()
+        self._counters.clear()
+
+    async def __aenter__(self) -> FakeUEServer:
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            async with self._client_lock:
+                while (frame := await self._read_frame(reader)) is not None:
+                    wire, data = frame
+                    response = await self._respond(wire, data)
+                    if response is None:
+                        break
+                    writer.write(response)
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by stop(); nothing awaits this handler task
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> tuple[codec.Codec, bytes] | None:
+        """Read one message in whichever framing the client used, or None on EOF."""
+        first = await reader.read(1)
+        if not first:
+            return None
+        if codec.is_msgpack_frame(first):
+            size = int.from_bytes(first + await reader.readexactly(3), "big")
+            return codec.get_codec("msgpack"), await reader.readexactly(size)
+        return codec.get_codec("json"), first + await reader.readline()
+
+    async def _respond(self, wire: codec.Codec, data: bytes) -> bytes | None:
+        """Return the encoded response, or None to drop the connection."""
+        fault = self._next_fault()
+        if fault == "drop":
+            return None
+        if fault == "stall":
+            await asyncio.sleep(self.faults.stall_seconds)
+        if self.faults.latency:
+            await asyncio.sleep(self.faults.latency)
+
+        try:
+            message = wire.decode(data)
+        except ValueError:
+            return wire.encode({"success": False, "error": "Invalid message"})
+
+        self.commands.append(message)
+        result = self.handle_command(message.get("command", ""), message.get("params") or {})
+        return wire.encode(result)
+
+    def _next_fault(self) -> str:
+        if self.faults.script:
+            return self.faults.script.popleft()
+        roll = self._rng.random()
+        if roll < self.faults.drop_rate:
+            return "drop"
+        if roll < self.faults.drop_rate + self.faults.stall_rate:
+            return "stall"
+        return "ok"
+
+    # ------------------------------------------------------------------
+    # Command handling
+    # ------------------------------------------------------------------
+
+    def handle_command(self, command: str, params: dict) -> dict:
+        handler = getattr(self, f"_cmd_{command}", None)
+        if handler is None:
+            return {"success": False, "error": "Unknown command"}
+        return handler(params)
+
+    def _cmd_negotiate_codec(self, params: dict) -> dict:
+        if not self.codecs:
+            return {"success": False, "error": "Unknown command"}
+        offered = params.get("codecs", [])
+        chosen = next((name for name in offered if name in self.codecs), "json")
+        return {"success": True, "codec": chosen}
+
+    def _new_actor(self, actor_type: str, transform: list[float]) -> dict:
+        count = self._counters.get(actor_type, 0) + 1
+        self._counters[actor_type] = count
+        actor = {
+            "actor_id": f"{actor_type}_{count}",
+            "class": actor_type,
+            "transform": _transform_dict(transform),
+            "visible": True,
+        }
+        self.actors[actor["actor_id"]] = actor
+        return actor
+
+    def _cmd_spawn_actor(self, params: dict) -> dict:
+        actor_type = params.get("actor_type", "")
+        position = [params.get("x", 0.0), params.get("y", 0.0), params.get("z", 0.0)]
+        actor = self._new_actor(actor_type, position + [0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+        return {
+            "success": True,
+            "actor_id": actor["actor_id"],
+            "actor_type": actor_type,
+            "transform": actor["transform"],
+        }
+
+    def _cmd_spawn_actors(self, params: dict) -> dict:
+        actor_type = params.get("actor_type", "")
+        ids = [self._new_actor(actor_type, t)["actor_id"] for t in params.get("transforms", [])]
+        return {"success": True, "actor_type": actor_type, "actor_ids": ids}
+
+    def _cmd_get_scene_info(self, params: dict) -> dict:
+        return {"success": True, "actors": [_public(a) for a in self.actors.values()]}
+
+    def _cmd_search_actors(self, params: dict) -> dict:
+        query = params.get("query", "")
+        needle = query.lower()
+        results = [
+            _public(a) for a in self.actors.values()
+            if needle in a["actor_id"].lower() or needle in a["class"].lower()
+        ]
+        return {"success": True, "query": query, "results": results}
+
+    def _cmd_delete_actor(self, params: dict) -> dict:
+        actor_id = params.get("actor_id", "")
+        if self.actors.pop(actor_id, None) is None:
+            return {"success": False, "error": f"Actor not found: {actor_id}"}
+        return {"success": True, "actor_id": actor_id}
+
+    def _cmd_set_transform(self, params: dict) -> dict:
+        actor_id = params.get("actor_id", "")
+        actor = self.actors.get(actor_id)
+        if actor is None:
+            return {"success": False, "error": f"Actor not found: {actor_id}"}
+        transform = actor["transform"]
+        for key, (group, axis) in _TRANSFORM_KEYS.items():
+            if key in params:
+                transform[group][axis] = params[key]
+        return {"success": True, "actor_id": actor_id, "transform": transform}
+
+    def _cmd_set_visibility(self, params: dict) -> dict:
+        actor_id = params.get("actor_id", "")
+        actor = self.actors.get(actor_id)
+        if actor is None:
+            return {"success": False, "error": f"Actor not found: {actor_id}"}
+        actor["visible"] = bool(params.get("visible", True))
+        return {"success": True, "actor_id": actor_id, "visible": actor["visible"]}
+
+    def _cmd_set_light_intensity(self, params: dict) -> dict:
+        actor_id = params.get("actor_id", "")
+        if actor_id not in self.actors:
+            return {"success": False, "error": f"Actor not found: {actor_id}"}
+        return {"success": True, "actor_id": actor_id, "intensity": params.get("intensity", 1.0)}
+
+    def _cmd_import_asset(self, params: dict) -> dict:
+        return {"success": True, "asset_path": f"/Game/Generated/{params.get('asset_name', '')}"}
+
+    def _cmd_apply_material(self, params: dict) -> dict:
+        actor_id = params.get("actor_id", "")
+        if actor_id not in self.actors:
+            return {"success": False, "error": f"Actor not found: {actor_id}"}
+        return {"success": True, "actor_id": actor_id, "material_path": f"/Game/Generated/M_{actor_id}"}
+
+
+_TRANSFORM_KEYS = {
+    "x": ("location", "x"), "y": ("location", "y"), "z": ("location", "z"),
+    "pitch": ("rotation", "pitch"), "yaw": ("rotation", "yaw"), "roll": ("rotation", "roll"),
+    "scale_x": ("scale", "x"), "scale_y": ("scale", "y"), "scale_z": ("scale", "z"),
+}
+
+
+class ReplayUEServer(FakeUEServer):
+    """Answers each command with the next recorded response for that command.
+
+    ``exchanges`` are records from a session recording's ``tcp.jsonl``.
+    Commands the recording has no (successful) response for fall back to the
+    in-memory scene and are counted in ``unmatched``.
+    """
+
+    def __init__(self, exchanges: list[dict], **kwargs):
+        super().__init__(**kwargs)
+        self._recorded: dict[str, deque[dict]] = {}
+        for exchange in exchanges:
+            if "response" in exchange:
+                self._recorded.setdefault(exchange["command"], deque()).append(exchange["response"])
+        self.unmatched = 0
+
+    def handle_command(self, command: str, params: dict) -> dict:
+        recorded = self._recorded.get(command)
+        if recorded:
+            return recorded.popleft()
+        self.unmatched += 1
+        return super().handle_command(command, params)
+
+
+def _transform_dict(transform: list[float]) -> dict:
+    # The plugin serialises transforms with two decimal places
+    t = [round(float(v), 2) for v in transform]
+    return {
+        "location": {"x": t[0], "y": t[1], "z": t[2]},
+        "rotation": {"pitch": t[3], "yaw": t[4], "roll": t[5]},
+        "scale": {"x": t[6], "y": t[7], "z": t[8]},
+    }
+
+
+def _public(actor: dict) -> dict:
+    return {key: actor[key] for key in ("actor_id", "class", "transform")}
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    faults = FaultConfig(
+        latency=args.latency,
+        stall_rate=args.stall_rate,
+        stall_seconds=args.stall_seconds,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    async with FakeUEServer(args.host, args.port, faults) as server:
+        print(f"Fake UE plugin listening on {server.host}:{server.port}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every command")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="fraction of commands that stall")
+    parser.add_argument("--stall-seconds", type=float, default=60.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction of connections dropped")
+    parser.add_argument("--seed", type=int, default=None)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""Vectorised transform generation for bulk actor placement.
+
+Every generator returns NumPy arrays so that thousands of transforms can be
+produced in a single call. Transforms are rows of nine floats laid out as
+``[x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z]`` — the same field
+order the UE plugin's ``spawn_actors`` command expects.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+TRANSFORM_FIELDS = (
+    "x", "y", "z",
+    "pitch", "yaw", "roll",
+    "scale_x", "scale_y", "scale_z",
+)
+
+# Upper bound on the occupancy grid used by scatter(); protects against a
+# tiny min_spacing over a huge extent allocating gigabytes.
+_MAX_SCATTER_CELLS = 20_000_000
+
+
+def grid(
+    rows: int,
+    cols: int,
+    spacing_x: float,
+    spacing_y: float,
+    origin: tuple[float, float, float] = (0.0, 0.0, 0.0),
+) -> np.ndarray:
+    """Return ``rows * cols`` locations on a regular grid starting at ``origin``."""
+    if rows < 1 or cols < 1:
+        raise ValueError("rows and cols must be at least 1")
+
+    ox, oy, oz = origin
+    ix, iy = np.meshgrid(np.arange(cols), np.arange(rows))
+    locations = np.empty((rows * cols, 3))
+    locations[:, 0] = ox + ix.ravel() * spacing_x
+    locations[:, 1] = oy + iy.ravel() * spacing_y
+    locations[:, 2] = oz
+    return locations
+
+
+def circle(
+    count: int,
+    center: tuple[float, float, float],
+    radius: float,
+    start_angle: float = 0.0,
+) -> np.ndarray:
+    """Return ``count`` locations evenly spaced on a horizontal circle.
+
+    ``start_angle`` is in degrees, measured from the +X axis.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    cx, cy, cz = center
+    angles = np.radians(start_angle) + np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+    locations = np.empty((count, 3))
+    locations[:, 0] = cx + radius * np.cos(angles)
+    locations[:, 1] = cy + radius * np.sin(angles)
+    locations[:, 2] = cz
+    return locations
+
+
+def scatter(
+    count: int,
+    center: tuple[float, float, float],
+    extent_x: float,
+    extent_y: float,
+    min_spacing: float = 0.0,
+    seed: int | np.random.SeedSequence | None = None,
+    max_rounds: int = 30,
+) -> np.ndarray:
+    """Return up to ``count`` random locations inside an axis-aligned rectangle.
+
+    ``extent_x``/``extent_y`` are half-sizes of the rectangle around ``center``.
+    When ``min_spacing`` is positive no two locations are closer than it
+    (Poisson-disk style). Candidates are drawn and tested in whole batches
+    against a background occupancy grid, so fewer than ``count`` locations are
+    returned only when the area cannot fit them within ``max_rounds`` rounds.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    if extent_x <= 0 or extent_y <= 0:
+        raise ValueError("extent_x and extent_y must be positive")
+
+    rng = np.random.default_rng(seed)
+    cx, cy, cz = center
+    low = np.array([cx - extent_x, cy - extent_y])
+    size = np.array([2.0 * extent_x, 2.0 * extent_y])
+
+    if min_spacing <= 0:
+        xy = low + rng.random((count, 2)) * size
+    else:
+        xy = _poisson_disk(count, low, size, min_spacing, rng, max_rounds)
+
+    locations = np.empty((len(xy), 3))
+    locations[:, :2] = xy
+    locations[:, 2] = cz
+    return locations
+
+
+def _poisson_disk(
+    count: int,
+    low: np.ndarray,
+    size: np.ndarray,
+    min_spacing: float,
+    rng: np.random.Generator,
+    max_rounds: int,
+) -> np.ndarray:
+    """Batch dart-throwing over a grid with one point per cell.
+
+    The cell size is ``min_spacing / sqrt(2)`` so a cell can hold at most one
+    accepted point and every conflicting point lies in the surrounding 5x5
+    block. Candidates are split into nine phases by ``(cx % 3, cy % 3)``;
+    two cells in the same phase are at least three cells apart, which is
+    further than ``min_spacing``, so candidates within a phase never conflict
+    with each other and can be accepted together.
+    """
+    cell = min_spacing / np.sqrt(2.0)
+    shape = np.ceil(size / cell).astype(int)
+    if int(shape[0]) * int(shape[1]) > _MAX_SCATTER_CELLS:
+        raise ValueError("min_spacing is too small for the requested extent")
+
+    # Occupancy grid padded by two cells on each side so the 5x5 neighbourhood
+    # lookup never leaves the array. NaN marks an empty cell.
+    occupied = np.full((shape[0] + 4, shape[1] + 4, 2), np.nan)
+    offsets = np.stack(np.meshgrid(np.arange(-2, 3), np.arange(-2, 3)), axis=-1).reshape(-1, 2)
+    accepted: list[np.ndarray] = []
+    total = 0
+
+    for _ in range(max_rounds):
+        remaining = count - total
+        if remaining <= 0:
+            break
+
+        candidates = low + rng.random((max(4 * remaining, 64), 2)) * size
+        cells = np.minimum(((candidates - low) / cell).astype(int), shape - 1)
+
+        for phase_x in range(3):
+            for phase_y in range(3):
+                mask = (cells[:, 0] % 3 == phase_x) & (cells[:, 1] % 3 == phase_y)
+                phase_points = candidates[mask]
+                phase_cells = cells[mask]
+                if len(phase_points) == 0:
+                    continue
+
+                # Keep the first candidate per cell.
+                _, first = np.unique(phase_cells, axis=0, return_index=True)
+                first.sort()
+                phase_points = phase_points[first]
+                phase_cells = phase_cells[first] + 2
+
+                neighbours = occupied[
+                    phase_cells[:, None, 0] + offsets[None, :, 0],
+                    phase_cells[:, None, 1] + offsets[None, :, 1],
+                ]
+                dist_sq = np.sum((neighbours - phase_points[:, None, :]) ** 2, axis=-1)
+                too_close = np.any(dist_sq < min_spacing ** 2, axis=1)  # NaN compares False
+
+                phase_points = phase_points[~too_close][:count - total]
+                phase_cells = phase_cells[~too_close][:len(phase_points)]
+                occupied[phase_cells[:, 0], phase_cells[:, 1]] = phase_points
+                accepted.append(phase_points)
+                total += len(phase_points)
+                if total >= count:
+                    break
+            if total >= count:
+                break
+
+    if not accepted:
+        return np.empty((0, 2))
+    return np.concatenate(accepted)
+
+
+def along_path(
+    points: np.ndarray | list[list[float]],
+    count: int,
+    smooth: bool = True,
+    closed: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``count`` locations evenly spaced by arc length along a path.
+
+    ``points`` are the path's control points, shape ``(M, 3)``. With
+    ``smooth`` the path is a Catmull-Rom spline through the control points,
+    otherwise a polyline. Also returns the yaw (degrees) of the path tangent
+    at each location so actors can be aligned to the path.
+    """
+    control = np.asarray(points, dtype=float)
+    if control.ndim != 2 or control.shape[1] != 3 or len(control) < 2:
+        raise ValueError("points must be a list of at least two [x, y, z] points")
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    if closed:
+        control = np.vstack([control, control[:1]])
+    path = _catmull_rom(control, closed) if smooth and len(control) > 2 else control
+
+    segment_lengths = np.linalg.norm(np.diff(path, axis=0), axis=1)
+    arc = np.concatenate([[0.0], np.cumsum(segment_lengths)])
+    if arc[-1] == 0:
+        raise ValueError("path has zero length")
+
+    targets = np.linspace(0.0, arc[-1], count, endpoint=not closed)
+    locations = np.column_stack([np.interp(targets, arc, path[:, axis]) for axis in range(3)])
+
+    segment = np.clip(np.searchsorted(arc, targets, side="right") - 1, 0, len(path) - 2)
+    tangent = path[segment + 1] - path[segment]
+    yaw = np.degrees(np.arctan2(tangent[:, 1], tangent[:, 0]))
+    return locations, yaw
+
+
+def _catmull_rom(control: np.ndarray, closed: bool, samples_per_segment: int = 16) -> np.ndarray:
+    """Densify ``control`` into a polyline sampled from a uniform Catmull-Rom spline."""
+    if closed:
+        padded = np.vstack([control[-2], control, control[1]])
+    else:
+        padded = np.vstack([2 * control[0] - control[1], control, 2 * control[-1] - control[-2]])
+
+    t = np.linspace(0.0, 1.0, samples_per_segment, endpoint=False)[:, None]
+    t2, t3 = t * t, t * t * t
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+
+    # (segments, samples, 3)
+    curve = 0.5 * (
+        (2 * p1)[:, None, :]
+        + (p2 - p0)[:, None, :] * t
+        + (2 * p0 - 5 * p1 + 4 * p2 - p3)[:, None, :] * t2
+        + (-p0 + 3 * p1 - 3 * p2 + p3)[:, None, :] * t3
+    )
+    return np.vstack([curve.reshape(-1, 3), control[-1:]])
+
+
+def make_transforms(
+    locations: np.ndarray,
+    yaw: np.ndarray | float = 0.0,
+    yaw_jitter: float = 0.0,
+    pitch_jitter: float = 0.0,
+    roll_jitter: float = 0.0,
+    scale_min: float = 1.0,
+    scale_max: float = 1.0,
+    seed: int | np.random.SeedSequence | None = None,
+) -> np.ndarray:
+    """Combine locations with (optionally jittered) rotation and uniform scale.
+
+    Jitter values are half-ranges in degrees: ``yaw_jitter=15`` adds a random
+    offset in ``[-15, 15]`` to ``yaw``. Scale is drawn uniformly from
+    ``[scale_min, scale_max]`` and applied to all three axes.
+
+    Returns:
+        Array of shape ``(N, 9)`` in ``TRANSFORM_FIELDS`` order.
+    """
+    if scale_min > scale_max:
+        raise ValueError("scale_min must not exceed scale_max")
+
+    n = len(locations)
+    rng = np.random.default_rng(seed)
+    transforms = np.empty((n, 9))
+    transforms[:, 0:3] = locations
+    transforms[:, 3] = rng.uniform(-pitch_jitter, pitch_jitter, n) if pitch_jitter else 0.0
+    transforms[:, 4] = yaw
+    if yaw_jitter:
+        transforms[:, 4] += rng.uniform(-yaw_jitter, yaw_jitter, n)
+    transforms[:, 5] = rng.uniform(-roll_jitter, roll_jitter, n) if roll_jitter else 0.0
+    if scale_max > scale_min:
+        transforms[:, 6:9] = rng.uniform(scale_min, scale_max, n)[:, None]
+    else:
+        transforms[:, 6:9] = scale_min
+    return transforms
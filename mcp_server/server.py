@@ -1,89 +1,315 @@
 """FastMCP server exposing Unreal Engine control tools over stdio.
 
-Tools communicate with the UE TCP plugin via newline-delimited JSON over TCP.
+Tools communicate with the UE TCP plugin over TCP, using the most compact
+codec both sides support (see ``mcp_server.codec``).
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import os
+import time
+import weakref
 
+import numpy as np
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from mcp_server import codec, placement
+from mcp_server.circuit_breaker import CircuitBreaker
+
 load_dotenv()
 
 UE_TCP_HOST = os.getenv("UE_TCP_HOST", "127.0.0.1")
 UE_TCP_PORT = int(os.getenv("UE_TCP_PORT", "9000"))
 
+# Deadlines (seconds) for a whole command: connect, send and response. Heavy
+# editor operations get a longer budget. ADK abandons any tool call after the
+# 30 s StdioConnectionParams timeout, so keep both below that.
+UE_TCP_CONNECT_TIMEOUT = float(os.getenv("UE_TCP_CONNECT_TIMEOUT", "2"))
+UE_TCP_TIMEOUT = float(os.getenv("UE_TCP_TIMEOUT", "5"))
+UE_TCP_HEAVY_TIMEOUT = float(os.getenv("UE_TCP_HEAVY_TIMEOUT", "25"))
+HEAVY_COMMANDS = frozenset({"import_asset", "apply_material", "spawn_actors"})
+
+# Read-only commands that are safe to resend after a connection failure.
+IDEMPOTENT_COMMANDS = frozenset({"get_scene_info", "search_actors"})
+UE_TCP_RETRIES = int(os.getenv("UE_TCP_RETRIES", "2"))
+UE_TCP_RETRY_BACKOFF = 0.05
+
+# Consecutive transport failures before failing fast, and how long to wait
+# before letting a trial command through.
+breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("UE_BREAKER_THRESHOLD", "3")),
+    reset_timeout=float(os.getenv("UE_BREAKER_RESET", "5")),
+)
+
+# Wire codecs to offer the plugin, in order of preference. The negotiated
+# codec is cached until a transport failure.
+UE_TCP_CODECS = [
+    name.strip() for name in os.getenv("UE_TCP_CODECS", "msgpack,json").split(",")
+    if name.strip() in codec.available_codecs()
+]
+_wire_codec: codec.Codec | None = None
+
+# Connections to the plugin open at once, shared by every tool call (and so by
+# every agent session using this server). The plugin serves one connection at
+# a time and queues the rest in its listen backlog (8), so keep this below
+# that. Waiters are admitted first come, first served, and the wait has its
+# own budget: it says nothing about the plugin's health, so it neither eats
+# into a command's deadline nor counts towards the circuit breaker.
+UE_TCP_MAX_CONCURRENCY = int(os.getenv("UE_TCP_MAX_CONCURRENCY", "4"))
+UE_TCP_QUEUE_TIMEOUT = float(os.getenv("UE_TCP_QUEUE_TIMEOUT", "10"))
+_connection_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+# When the plugin last answered a command (time.monotonic()). A command that
+# times out after another one was answered was queued behind it in the
+# plugin's listen backlog, not stuck on an unresponsive plugin.
+_last_response = float("-inf")
+
+# Append every exchange with the plugin to this JSONL file (set by session
+# recordings, see agents.recording); empty or unset disables recording.
+UE_TCP_RECORD = os.getenv("UE_TCP_RECORD") or None
+
+# Bulk placement: transforms per spawn_actors command. One placement keeps
+# at most UE_SPAWN_MAX_IN_FLIGHT batches queued for a connection so other
+# sessions' commands interleave with a large placement.
+UE_SPAWN_BATCH_SIZE = int(os.getenv("UE_SPAWN_BATCH_SIZE", "500"))
+UE_SPAWN_MAX_IN_FLIGHT = int(os.getenv("UE_SPAWN_MAX_IN_FLIGHT", "2"))
+
 mcp = FastMCP("UnrealEngineControl")
 
 
-async def send_command(command: str, params: dict | None = None) -> dict:
-    """Send a JSON command to the UE TCP plugin and return the parsed response."""
+async def send_command(command: str, params: dict | None = None, timeout: float | None = None) -> dict:
+    """Send a JSON command to the UE TCP plugin and return the parsed response.
+
+    Waits up to ``UE_TCP_QUEUE_TIMEOUT`` for a free connection slot; after
+    that the whole exchange (connect, send, response) must finish within
+    ``timeout`` seconds, defaulting by command weight. Transport failures
+    never raise: they come back as ``{"success": False, "error": ...}`` like
+    plugin errors, so the agent can report them. Idempotent reads are retried
+    on connection failures within the same deadline; timeouts are not
+    retried, since a stalled plugin would only queue the retry behind the
+    stalled command. A timeout counts towards the circuit breaker only if the
+    plugin answered nothing while the command waited. A command that cannot
+    be encoded, or a reply that cannot be decoded, is reported as an error
+    without retrying or tripping the breaker. Cancellation propagates
+    and aborts the connection immediately.
+    """
     message = {"command": command}
     if params:
         message["params"] = params
 
-    reader, writer = await asyncio.open_connection(UE_TCP_HOST, UE_TCP_PORT)
+    if timeout is None:
+        timeout = UE_TCP_HEAVY_TIMEOUT if command in HEAVY_COMMANDS else UE_TCP_TIMEOUT
+
+    if not breaker.allow():
+        return {
+            "success": False,
+            "error": (
+                f"UE plugin at {UE_TCP_HOST}:{UE_TCP_PORT} is unreachable; "
+                f"not retrying for {breaker.retry_after():.1f}s"
+            ),
+        }
+
+    slots = _slots()
     try:
-        payload = json.dumps(message) + "\n"
-        writer.write(payload.encode())
-        await writer.drain()
+        async with asyncio.timeout(UE_TCP_QUEUE_TIMEOUT):
+            await slots.acquire()
+    except TimeoutError:
+        return {
+            "success": False,
+            "error": (
+                f"Gave up on {command} after waiting {UE_TCP_QUEUE_TIMEOUT:.1f}s "
+                "for a free connection to the UE plugin"
+            ),
+        }
+    try:
+        return await _send_within_deadline(command, message, timeout)
+    finally:
+        slots.release()
+
+
+async def _send_within_deadline(command: str, message: dict, timeout: float) -> dict:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    started = time.monotonic()
+    attempts = 1 + (UE_TCP_RETRIES if command in IDEMPOTENT_COMMANDS else 0)
+
+    attempt = 0
+    while True:
+        try:
+            async with asyncio.timeout_at(deadline):
+                result = await _exchange(message, await _negotiated_codec())
+        except TimeoutError:
+            if _last_response < started:
+                _forget_codec()
+                breaker.record_failure()
+            return {
+                "success": False,
+                "error": f"Timed out after {timeout:.1f}s waiting for UE plugin to run {command}",
+            }
+        except codec.CodecError as exc:
+            # Not a sign of an unreachable plugin, and resending won't help
+            return {"success": False, "error": f"UE command {command} failed: {exc}"}
+        except OSError as exc:
+            backoff = UE_TCP_RETRY_BACKOFF * 2 ** attempt
+            attempt += 1
+            if attempt < attempts and loop.time() + backoff < deadline:
+                await asyncio.sleep(backoff)
+                continue
+            _forget_codec()
+            breaker.record_failure()
+            return {
+                "success": False,
+                "error": f"Could not reach UE plugin at {UE_TCP_HOST}:{UE_TCP_PORT}: {exc}",
+            }
+
+        breaker.record_success()
+        return result
+
+
+async def _negotiated_codec() -> codec.Codec:
+    """Return the wire codec agreed with the plugin, negotiating on first use."""
+    global _wire_codec
+    if _wire_codec is not None:
+        return _wire_codec
+
+    chosen = "json"
+    if UE_TCP_CODECS and UE_TCP_CODECS != ["json"]:
+        # Older plugins reply "Unknown command", which leaves us on json
+        reply = await _exchange(
+            {"command": "negotiate_codec", "params": {"codecs": UE_TCP_CODECS}},
+            codec.get_codec("json"),
+        )
+        if reply.get("success") and reply.get("codec") in UE_TCP_CODECS:
+            chosen = reply["codec"]
+
+    _wire_codec = codec.get_codec(chosen)
+    return _wire_codec
+
+
+def _forget_codec() -> None:
+    """Re-negotiate on the next command; the plugin may have been restarted."""
+    global _wire_codec
+    _wire_codec = None
+
+
+def _slots() -> asyncio.Semaphore:
+    """This event loop's connection slots."""
+    loop = asyncio.get_running_loop()
+    slots = _connection_slots.get(loop)
+    if slots is None:
+        slots = _connection_slots[loop] = asyncio.Semaphore(UE_TCP_MAX_CONCURRENCY)
+    return slots
+
+
+async def _exchange(message: dict, wire: codec.Codec) -> dict:
+    """Run one request/response round trip; the caller holds a connection slot."""
+    if UE_TCP_RECORD is None:
+        return await _exchange_on_new_connection(message, wire)
+    return await _recorded_exchange(message, wire)
+
+
+async def _recorded_exchange(message: dict, wire: codec.Codec) -> dict:
+    record = {"time": time.time(), **message}
+    start = time.perf_counter()
+    try:
+        record["response"] = await _exchange_on_new_connection(message, wire)
+        return record["response"]
+    except BaseException as exc:
+        record["error"] = repr(exc)
+        raise
+    finally:
+        record["elapsed"] = time.perf_counter() - start
+        with open(UE_TCP_RECORD, "ab") as f:
+            f.write(codec.get_codec("json").encode(record))
+
+
+async def _exchange_on_new_connection(message: dict, wire: codec.Codec) -> dict:
+    global _last_response
+    try:
+        data = wire.encode(message)
+    except (TypeError, ValueError) as exc:
+        raise codec.CodecError(f"could not encode the command: {exc}") from exc
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            # Newline-delimited replies may be as large as a msgpack frame
+            asyncio.open_connection(UE_TCP_HOST, UE_TCP_PORT, limit=codec.MAX_FRAME_SIZE + 1),
+            UE_TCP_CONNECT_TIMEOUT,
+        )
+    except TimeoutError as exc:
+        raise ConnectionError("connect timed out") from exc
 
-        data = await reader.readline()
-        return json.loads(data.decode())
+    try:
+        writer.write(data)
+        await writer.drain()
+        try:
+            frame = await wire.read_frame(reader)
+        except ValueError as exc:
+            # StreamReader.readline() raises ValueError past its limit
+            raise codec.CodecError(f"reply too large: {exc}") from exc
+        _last_response = time.monotonic()
+        try:
+            return wire.decode(frame)
+        except ValueError as exc:
+            raise codec.CodecError(f"malformed reply from the UE plugin: {exc}") from exc
+    except BaseException:
+        # Don't wait to flush unsent data to a plugin that may be stalled
+        writer.transport.abort()
+        raise
     finally:
         writer.close()
-        await writer.wait_closed()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
 
 
 @mcp.tool
-async def spawn_actor(actor_type: str, x: float, y: float, z: float) -> str:
+async def spawn_actor(actor_type: str, x: float, y: float, z: float) -> dict:
     """Spawn a new actor in the Unreal Engine scene.
 
     Args:
-        actor_type: The type of actor to spawn (e.g. 'StaticMeshActor', 'PointLight').
+        actor_type: The type of actor to spawn: StaticMeshActor, PointLight,
+            SpotLight, DirectionalLight, CameraActor or PlayerStart.
         x: X position in world space.
         y: Y position in world space.
         z: Z position in world space.
 
     Returns:
-        JSON string with spawn result including the new actor's ID.
+        JSON object with spawn result including the new actor's ID.
     """
-    result = await send_command("spawn_actor", {
+    return await send_command("spawn_actor", {
         "actor_type": actor_type,
         "x": x,
         "y": y,
         "z": z,
     })
-    return json.dumps(result)
 
 
 @mcp.tool
-async def get_scene_info() -> str:
+async def get_scene_info() -> dict:
     """Query the current Unreal Engine scene for all actors and their properties.
 
     Returns:
-        JSON string with scene information including actor list.
+        JSON object with scene information including actor list.
     """
-    result = await send_command("get_scene_info")
-    return json.dumps(result)
+    return await send_command("get_scene_info")
 
 
 @mcp.tool
-async def delete_actor(actor_id: str) -> str:
+async def delete_actor(actor_id: str) -> dict:
     """Delete an actor from the Unreal Engine scene.
 
     Args:
         actor_id: The ID (label) of the actor to delete.
 
     Returns:
-        JSON string with the deletion result.
+        JSON object with the deletion result.
     """
-    result = await send_command("delete_actor", {"actor_id": actor_id})
-    return json.dumps(result)
+    return await send_command("delete_actor", {"actor_id": actor_id})
 
 
 @mcp.tool
@@ -98,7 +324,7 @@ async def set_transform(
     scale_x: float | None = None,
     scale_y: float | None = None,
     scale_z: float | None = None,
-) -> str:
+) -> dict:
     """Set the transform (position, rotation, scale) of an existing actor.
 
     Only provided parameters are updated; omitted parameters keep their current values.
@@ -116,7 +342,7 @@ async def set_transform(
         scale_z: Z scale factor.
 
     Returns:
-        JSON string with the updated transform.
+        JSON object with the updated transform.
     """
     params: dict = {"actor_id": actor_id}
     for key, value in [
@@ -127,12 +353,11 @@ async def set_transform(
         if value is not None:
             params[key] = value
 
-    result = await send_command("set_transform", params)
-    return json.dumps(result)
+    return await send_command("set_transform", params)
 
 
 @mcp.tool
-async def import_asset(file_path: str, asset_name: str) -> str:
+async def import_asset(file_path: str, asset_name: str) -> dict:
     """Import an external file (e.g. a generated image) into the UE project as an asset.
 
     Args:
@@ -140,17 +365,16 @@ async def import_asset(file_path: str, asset_name: str) -> str:
         asset_name: Name for the imported asset inside UE (placed under /Game/Generated/).
 
     Returns:
-        JSON string with import result including the UE asset path.
+        JSON object with import result including the UE asset path.
     """
-    result = await send_command("import_asset", {
+    return await send_command("import_asset", {
         "file_path": file_path,
         "asset_name": asset_name,
     })
-    return json.dumps(result)
 
 
 @mcp.tool
-async def apply_material(actor_id: str, texture_asset_path: str) -> str:
+async def apply_material(actor_id: str, texture_asset_path: str) -> dict:
     """Apply a texture as a material to an actor's mesh.
 
     Args:
@@ -158,17 +382,16 @@ async def apply_material(actor_id: str, texture_asset_path: str) -> str:
         texture_asset_path: The UE asset path of the texture (e.g. /Game/Generated/my_texture).
 
     Returns:
-        JSON string with the result including the created material path.
+        JSON object with the result including the created material path.
     """
-    result = await send_command("apply_material", {
+    return await send_command("apply_material", {
         "actor_id": actor_id,
         "texture_asset_path": texture_asset_path,
     })
-    return json.dumps(result)
 
 
 @mcp.tool
-async def search_actors(query: str) -> str:
+async def search_actors(query: str) -> dict:
     """Search for actors in the scene by name or class.
 
     Performs a case-insensitive substring match against actor labels and class names.
@@ -178,14 +401,13 @@ async def search_actors(query: str) -> str:
         query: Search string to match against actor labels and class names.
 
     Returns:
-        JSON string with matching actors including their IDs, classes, and transforms.
+        JSON object with matching actors including their IDs, classes, and transforms.
     """
-    result = await send_command("search_actors", {"query": query})
-    return json.dumps(result)
+    return await send_command("search_actors", {"query": query})
 
 
 @mcp.tool
-async def set_visibility(actor_id: str, visible: bool) -> str:
+async def set_visibility(actor_id: str, visible: bool) -> dict:
     """Show or hide an actor in the scene.
 
     Args:
@@ -193,17 +415,16 @@ async def set_visibility(actor_id: str, visible: bool) -> str:
         visible: True to make the actor visible, False to hide it.
 
     Returns:
-        JSON string with the result including the new visibility state.
+        JSON object with the result including the new visibility state.
     """
-    result = await send_command("set_visibility", {
+    return await send_command("set_visibility", {
         "actor_id": actor_id,
         "visible": visible,
     })
-    return json.dumps(result)
 
 
 @mcp.tool
-async def set_light_intensity(actor_id: str, intensity: float) -> str:
+async def set_light_intensity(actor_id: str, intensity: float) -> dict:
     """Set the brightness of a light actor.
 
     Works with PointLight, SpotLight, DirectionalLight, and SkyLight actors.
@@ -214,13 +435,246 @@ async def set_light_intensity(actor_id: str, intensity: float) -> str:
         intensity: Brightness scale factor (1.0 = default intensity).
 
     Returns:
-        JSON string with the result including the new intensity value.
+        JSON object with the result including the new intensity value.
     """
-    result = await send_command("set_light_intensity", {
+    return await send_command("set_light_intensity", {
         "actor_id": actor_id,
         "intensity": intensity,
     })
-    return json.dumps(result)
+
+
+async def spawn_transforms(actor_type: str, transforms: np.ndarray, requested: int | None = None) -> dict:
+    """Spawn one actor per transform row using batched ``spawn_actors`` commands.
+
+    Rows are split into batches of ``UE_SPAWN_BATCH_SIZE`` and sent with at most
+    ``UE_SPAWN_MAX_IN_FLIGHT`` commands in flight. A failed batch does not stop
+    the others; failures are reported in the summary. ``requested`` is the
+    count the agent asked for, when the layout produced fewer transforms; the
+    summary then fails with a warning about the shortfall.
+    """
+    semaphore = asyncio.Semaphore(UE_SPAWN_MAX_IN_FLIGHT)
+    batches = [
+        transforms[start:start + UE_SPAWN_BATCH_SIZE]
+        for start in range(0, len(transforms), UE_SPAWN_BATCH_SIZE)
+    ]
+
+    async def send_batch(batch: np.ndarray) -> dict:
+        async with semaphore:
+            return await send_command("spawn_actors", {
+                "actor_type": actor_type,
+                "transforms": np.round(batch, 3),
+            })
+
+    results = await asyncio.gather(*(send_batch(batch) for batch in batches))
+
+    actor_ids: list[str] = []
+    errors: list[str] = []
+    for result in results:
+        actor_ids.extend(result.get("actor_ids", []))
+        if not result.get("success"):
+            errors.append(result.get("error", "Unknown error"))
+
+    if requested is None:
+        requested = len(transforms)
+    summary: dict = {
+        "success": not errors and len(actor_ids) == requested,
+        "actor_type": actor_type,
+        "requested": requested,
+        "spawned": len(actor_ids),
+        "batches": len(batches),
+        # Returning every ID for thousands of actors would flood the agent's
+        # context; search_actors can resolve individual actors later.
+        "actor_ids_sample": actor_ids[:10],
+    }
+    if errors:
+        summary["errors"] = errors[:5]
+    if len(transforms) < requested:
+        summary["warning"] = (
+            f"Only {len(transforms)} of {requested} actors fit in the area at the "
+            "requested spacing; enlarge the area or reduce the spacing or count"
+        )
+    return summary
+
+
+@mcp.tool
+async def place_grid(
+    actor_type: str,
+    rows: int,
+    cols: int,
+    spacing_x: float,
+    spacing_y: float,
+    origin_x: float = 0.0,
+    origin_y: float = 0.0,
+    origin_z: float = 0.0,
+    yaw: float = 0.0,
+    yaw_jitter: float = 0.0,
+    scale_min: float = 1.0,
+    scale_max: float = 1.0,
+    seed: int | None = None,
+) -> dict:
+    """Spawn many actors on a regular grid in a single call.
+
+    Use this instead of repeated spawn_actor calls when placing rows, columns
+    or arrays of identical actors.
+
+    Args:
+        actor_type: The type of actor to spawn (e.g. 'StaticMeshActor', 'PointLight').
+        rows: Number of rows (along Y).
+        cols: Number of columns (along X).
+        spacing_x: Distance between columns in world units.
+        spacing_y: Distance between rows in world units.
+        origin_x: X position of the first grid cell.
+        origin_y: Y position of the first grid cell.
+        origin_z: Z position of every actor.
+        yaw: Base yaw rotation in degrees.
+        yaw_jitter: Random yaw offset range in degrees (+/-).
+        scale_min: Minimum uniform scale factor.
+        scale_max: Maximum uniform scale factor.
+        seed: Random seed for jitter, for reproducible layouts.
+
+    Returns:
+        JSON object summarising how many actors were spawned.
+    """
+    locations = placement.grid(rows, cols, spacing_x, spacing_y, (origin_x, origin_y, origin_z))
+    transforms = placement.make_transforms(
+        locations, yaw=yaw, yaw_jitter=yaw_jitter,
+        scale_min=scale_min, scale_max=scale_max, seed=seed,
+    )
+    return await spawn_transforms(actor_type, transforms)
+
+
+@mcp.tool
+async def place_scatter(
+    actor_type: str,
+    count: int,
+    center_x: float,
+    center_y: float,
+    center_z: float,
+    extent_x: float,
+    extent_y: float,
+    min_spacing: float = 0.0,
+    yaw_jitter: float = 180.0,
+    scale_min: float = 1.0,
+    scale_max: float = 1.0,
+    seed: int | None = None,
+) -> dict:
+    """Spawn many actors at random positions inside a rectangular area in a single call.
+
+    Useful for natural-looking distributions such as forests or rocks.
+
+    Args:
+        actor_type: The type of actor to spawn (e.g. 'StaticMeshActor', 'PointLight').
+        count: Number of actors to spawn.
+        center_x: X position of the area's centre.
+        center_y: Y position of the area's centre.
+        center_z: Z position of every actor.
+        extent_x: Half-width of the area along X.
+        extent_y: Half-width of the area along Y.
+        min_spacing: Minimum distance between any two actors (0 = no limit).
+        yaw_jitter: Random yaw range in degrees (+/-); 180 gives fully random facing.
+        scale_min: Minimum uniform scale factor.
+        scale_max: Maximum uniform scale factor.
+        seed: Random seed, for reproducible layouts.
+
+    Returns:
+        JSON object summarising how many actors were spawned. If the area
+        cannot fit count actors at min_spacing, the ones that fit are placed
+        and the result has success false and a warning.
+    """
+    # Separate streams, so facing and scale are not a function of position
+    position_seed, jitter_seed = np.random.SeedSequence(seed).spawn(2)
+    locations = placement.scatter(
+        count, (center_x, center_y, center_z), extent_x, extent_y,
+        min_spacing=min_spacing, seed=position_seed,
+    )
+    transforms = placement.make_transforms(
+        locations, yaw_jitter=yaw_jitter,
+        scale_min=scale_min, scale_max=scale_max, seed=jitter_seed,
+    )
+    return await spawn_transforms(actor_type, transforms, requested=count)
+
+
+@mcp.tool
+async def place_circle(
+    actor_type: str,
+    count: int,
+    center_x: float,
+    center_y: float,
+    center_z: float,
+    radius: float,
+    face_center: bool = False,
+    yaw_jitter: float = 0.0,
+    scale_min: float = 1.0,
+    scale_max: float = 1.0,
+    seed: int | None = None,
+) -> dict:
+    """Spawn many actors evenly spaced around a circle in a single call.
+
+    Args:
+        actor_type: The type of actor to spawn (e.g. 'StaticMeshActor', 'PointLight').
+        count: Number of actors to spawn.
+        center_x: X position of the circle's centre.
+        center_y: Y position of the circle's centre.
+        center_z: Z position of every actor.
+        radius: Circle radius in world units.
+        face_center: True to rotate each actor to face the centre.
+        yaw_jitter: Random yaw offset range in degrees (+/-).
+        scale_min: Minimum uniform scale factor.
+        scale_max: Maximum uniform scale factor.
+        seed: Random seed for jitter, for reproducible layouts.
+
+    Returns:
+        JSON object summarising how many actors were spawned.
+    """
+    locations = placement.circle(count, (center_x, center_y, center_z), radius)
+    yaw = 0.0
+    if face_center:
+        yaw = np.degrees(np.arctan2(center_y - locations[:, 1], center_x - locations[:, 0]))
+    transforms = placement.make_transforms(
+        locations, yaw=yaw, yaw_jitter=yaw_jitter,
+        scale_min=scale_min, scale_max=scale_max, seed=seed,
+    )
+    return await spawn_transforms(actor_type, transforms)
+
+
+@mcp.tool
+async def place_along_path(
+    actor_type: str,
+    count: int,
+    path_points: list[list[float]],
+    smooth: bool = True,
+    closed: bool = False,
+    align_to_path: bool = True,
+    yaw_jitter: float = 0.0,
+    scale_min: float = 1.0,
+    scale_max: float = 1.0,
+    seed: int | None = None,
+) -> dict:
+    """Spawn many actors evenly spaced along a path in a single call.
+
+    Useful for fences, street lights, or trees lining a road.
+
+    Args:
+        actor_type: The type of actor to spawn (e.g. 'StaticMeshActor', 'PointLight').
+        count: Number of actors to spawn.
+        path_points: Control points of the path as [[x, y, z], ...] (at least two).
+        smooth: True to follow a smooth spline through the points, False for straight segments.
+        closed: True to join the last point back to the first.
+        align_to_path: True to rotate each actor to face along the path.
+        yaw_jitter: Random yaw offset range in degrees (+/-).
+        scale_min: Minimum uniform scale factor.
+        scale_max: Maximum uniform scale factor.
+        seed: Random seed for jitter, for reproducible layouts.
+
+    Returns:
+        JSON object summarising how many actors were spawned.
+    """
+    locations, path_yaw = placement.along_path(path_points, count, smooth=smooth, closed=closed)
+    transforms = placement.make_transforms(
+        locations, yaw=path_yaw if align_to_path else 0.0, yaw_jitter=yaw_jitter,
+        scale_min=scale_min, scale_max=scale_max, seed=seed,
+    )
+    return await spawn_transforms(actor_type, transforms)
 
 
 if __name__ == "__main__":
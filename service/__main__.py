@@ -0,0 +1,45 @@
+"""Run the agent as a local multi-session HTTP/WebSocket service.
+
+    python -m service --port 8080 --max-turns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import uvicorn
+from dotenv import load_dotenv
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from agents.orchestrator.agent import orchestrator_agent
+from service.app import AgentService, create_app
+from service.scheduler import FairScheduler
+
+APP_NAME = "unreal_agentic_control"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Unreal Engine Agentic Control service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-turns", type=int, default=8, help="agent turns running at once")
+    parser.add_argument(
+        "--session-idle-timeout", type=float, default=3600.0,
+        help="seconds without a turn before a session is removed",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+
+    runner = Runner(
+        app_name=APP_NAME,
+        agent=orchestrator_agent,
+        session_service=InMemorySessionService(),
+    )
+    service = AgentService(runner, FairScheduler(args.max_turns), idle_timeout=args.session_idle_timeout)
+    uvicorn.run(create_app(service), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
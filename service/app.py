@@ -0,0 +1,222 @@
+"""HTTP/WebSocket API serving the agent runner to many concurrent sessions.
+
+All sessions share one event loop, one Runner and therefore one MCP toolset
+(a single MCP server subprocess, whose UE connections are bounded by
+``UE_TCP_MAX_CONCURRENCY``). Turns are admitted by a ``FairScheduler``.
+
+Endpoints:
+
+- ``POST /sessions`` — create a session, returns ``{"session_id": ...}``.
+- ``DELETE /sessions/{session_id}`` — end a session (409 while it has a turn
+  running or waiting).
+- ``POST /sessions/{session_id}/turns`` — run one turn, streaming events as
+  newline-delimited JSON.
+- ``WS /sessions/{session_id}/ws`` — send ``{"message": ...}`` frames;
+  receives one frame per event, then ``{"type": "turn_complete"}``.
+- ``GET /stats`` — session count and scheduler queue depth.
+
+A turn that fails ends with ``{"type": "error", "error": ...}`` instead of
+``turn_complete``; a malformed WebSocket frame gets the same reply and the
+socket stays open. Sessions idle for longer than ``idle_timeout`` are
+removed when the next session is created.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+from service.scheduler import FairScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRequest(BaseModel):
+    user_id: str = "service_user"
+
+
+class TurnRequest(BaseModel):
+    message: str
+
+
+class AgentService:
+    """Runs agent turns for many sessions through one shared Runner."""
+
+    def __init__(
+        self,
+        runner: Runner,
+        scheduler: FairScheduler,
+        idle_timeout: float | None = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.runner = runner
+        self.scheduler = scheduler
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._users: dict[str, str] = {}
+        self._last_used: dict[str, float] = {}
+
+    @property
+    def sessions(self) -> int:
+        return len(self._users)
+
+    def has_session(self, session_id: str) -> bool:
+        return session_id in self._users
+
+    async def create_session(self, user_id: str) -> str:
+        await self.expire_idle_sessions()
+        session = await self.runner.session_service.create_session(
+            app_name=self.runner.app_name,
+            user_id=user_id,
+        )
+        self._users[session.id] = user_id
+        self._last_used[session.id] = self._clock()
+        return session.id
+
+    async def delete_session(self, session_id: str) -> None:
+        """Forget a session and its history; raises KeyError if unknown."""
+        user_id = self._users.pop(session_id)
+        self._last_used.pop(session_id, None)
+        await self.runner.session_service.delete_session(
+            app_name=self.runner.app_name,
+            user_id=user_id,
+            session_id=session_id,
+        )
+
+    async def expire_idle_sessions(self) -> int:
+        """Delete sessions with no turn for ``idle_timeout`` seconds; returns how many."""
+        if self.idle_timeout is None:
+            return 0
+        cutoff = self._clock() - self.idle_timeout
+        idle = [
+            session_id for session_id, last_used in self._last_used.items()
+            if last_used < cutoff and not self.scheduler.busy(session_id)
+        ]
+        for session_id in idle:
+            await self.delete_session(session_id)
+        return len(idle)
+
+    async def run_turn(self, session_id: str, message: str) -> AsyncIterator[dict]:
+        """Run one turn once the scheduler admits it, yielding event payloads."""
+        user_id = self._users.get(session_id)
+        if user_id is None:
+            raise KeyError(session_id)
+
+        content = types.Content(role="user", parts=[types.Part(text=message)])
+        async with self.scheduler.turn(session_id):
+            start = time.perf_counter()
+            try:
+                async for event in self.runner.run_async(
+                    session_id=session_id,
+                    user_id=user_id,
+                    new_message=content,
+                ):
+                    yield event_payload(event)
+            except Exception as exc:
+                logger.exception("Turn failed in session %s", session_id)
+                yield {"type": "error", "error": f"{type(exc).__name__}: {exc}"}
+                return
+            finally:
+                if session_id in self._users:
+                    self._last_used[session_id] = self._clock()
+            yield {"type": "turn_complete", "elapsed": time.perf_counter() - start}
+
+    async def close(self) -> None:
+        await self.runner.close()
+
+
+def event_payload(event: Event) -> dict:
+    """Project an ADK event onto the JSON fields clients need."""
+    text = "".join(
+        part.text for part in (event.content.parts if event.content and event.content.parts else [])
+        if part.text and not part.thought
+    )
+    payload: dict = {
+        "type": "event",
+        "author": event.author,
+        "partial": bool(event.partial),
+        "final": event.is_final_response(),
+    }
+    if text:
+        payload["text"] = text
+    if calls := event.get_function_calls():
+        payload["tool_calls"] = [{"name": call.name, "args": call.args} for call in calls]
+    if responses := event.get_function_responses():
+        payload["tool_results"] = [{"name": r.name, "response": r.response} for r in responses]
+    if event.error_message:
+        payload["error"] = event.error_message
+    return payload
+
+
+def create_app(service: AgentService) -> FastAPI:
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        await service.close()
+
+    app = FastAPI(title="Unreal Engine Agentic Control", lifespan=lifespan)
+
+    @app.post("/sessions")
+    async def create_session(request: SessionRequest) -> dict:
+        return {"session_id": await service.create_session(request.user_id)}
+
+    @app.delete("/sessions/{session_id}", status_code=204)
+    async def delete_session(session_id: str) -> None:
+        if not service.has_session(session_id):
+            raise HTTPException(status_code=404, detail="Unknown session")
+        if service.scheduler.busy(session_id):
+            raise HTTPException(status_code=409, detail="Session has a turn in progress")
+        await service.delete_session(session_id)
+
+    @app.post("/sessions/{session_id}/turns")
+    async def run_turn(session_id: str, request: TurnRequest) -> StreamingResponse:
+        if not service.has_session(session_id):
+            raise HTTPException(status_code=404, detail="Unknown session")
+
+        async def stream() -> AsyncIterator[bytes]:
+            async for payload in service.run_turn(session_id, request.message):
+                yield (json.dumps(payload, default=str) + "\n").encode()
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    @app.websocket("/sessions/{session_id}/ws")
+    async def session_socket(websocket: WebSocket, session_id: str) -> None:
+        if not service.has_session(session_id):
+            await websocket.close(code=4404, reason="Unknown session")
+            return
+
+        await websocket.accept()
+        try:
+            while True:
+                try:
+                    request = TurnRequest.model_validate_json(await websocket.receive_text())
+                except ValidationError as exc:
+                    await websocket.send_json({"type": "error", "error": f"Invalid request: {exc}"})
+                    continue
+                if not service.has_session(session_id):
+                    await websocket.close(code=4404, reason="Session ended")
+                    return
+                async for payload in service.run_turn(session_id, request.message):
+                    await websocket.send_text(json.dumps(payload, default=str))
+        except WebSocketDisconnect:
+            pass
+
+    @app.get("/stats")
+    async def stats() -> dict:
+        return {
+            "sessions": service.sessions,
+            "running_turns": service.scheduler.running,
+            "waiting_turns": service.scheduler.waiting,
+        }
+
+    return app
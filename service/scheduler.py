@@ -0,0 +1,90 @@
+"""Fair scheduling of agent turns across concurrent sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator
+
+
+class FairScheduler:
+    """Admit agent turns round-robin across sessions, with a global limit.
+
+    At most ``max_concurrent_turns`` turns run at once, and each session runs
+    at most one turn at a time (ADK sessions are not safe for overlapping
+    turns). When a slot frees up it goes to the next waiting session in
+    rotation, so a client that queues many turns cannot starve the others.
+    """
+
+    def __init__(self, max_concurrent_turns: int = 8):
+        if max_concurrent_turns < 1:
+            raise ValueError("max_concurrent_turns must be at least 1")
+        self.max_concurrent_turns = max_concurrent_turns
+        # Insertion order is the rotation order; a session moves to the back
+        # each time it is granted a slot and again when its turn finishes.
+        self._queues: dict[str, deque[asyncio.Future]] = {}
+        self._active: set[str] = set()
+
+    @property
+    def running(self) -> int:
+        return len(self._active)
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def busy(self, session_id: str) -> bool:
+        """True if ``session_id`` has a turn running or waiting."""
+        return session_id in self._active or bool(self._queues.get(session_id))
+
+    @contextlib.asynccontextmanager
+    async def turn(self, session_id: str) -> AsyncIterator[None]:
+        """Hold a turn slot for ``session_id`` for the duration of the block."""
+        await self._acquire(session_id)
+        try:
+            yield
+        finally:
+            self._release(session_id)
+
+    async def _acquire(self, session_id: str) -> None:
+        granted = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session_id, deque()).append(granted)
+        self._dispatch()
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if granted.done() and not granted.cancelled():
+                # Granted just as we were cancelled; hand the slot on
+                self._release(session_id)
+            else:
+                queue = self._queues.get(session_id)
+                if queue is not None and granted in queue:
+                    queue.remove(granted)
+                    if not queue and session_id not in self._active:
+                        del self._queues[session_id]
+            raise
+
+    def _release(self, session_id: str) -> None:
+        self._active.discard(session_id)
+        queue = self._queues.pop(session_id, None)
+        if queue:
+            self._queues[session_id] = queue
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while len(self._active) < self.max_concurrent_turns:
+            session_id = next(
+                (sid for sid, queue in self._queues.items() if queue and sid not in self._active),
+                None,
+            )
+            if session_id is None:
+                return
+            queue = self._queues.pop(session_id)
+            granted = queue.popleft()
+            # Skip waiters cancelled before their cancellation was handled
+            if not granted.done():
+                granted.set_result(None)
+                self._active.add(session_id)
+            if queue or session_id in self._active:
+                self._queues[session_id] = queue
@@ -0,0 +1,120 @@
+"""Tests for wire codecs and codec negotiation with the plugin."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mcp_server import codec, server
+from mcp_server.circuit_breaker import CircuitBreaker
+from mcp_server.fake_ue import FakeUEServer
+
+needs_msgpack = pytest.mark.skipif(codec.msgpack is None, reason="msgpack not installed (fast extra)")
+needs_orjson = pytest.mark.skipif(codec.orjson is None, reason="orjson not installed (fast extra)")
+
+MESSAGE = {
+    "command": "spawn_actors",
+    "params": {
+        "actor_type": "StaticMeshActor",
+        "transforms": np.array([[1.5, 2.0, 3.0, 0.0, 90.0, 0.0, 1.0, 1.0, 1.0]] * 4),
+    },
+}
+
+
+async def _read_back(wire: codec.Codec, data: bytes) -> dict:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return wire.decode(await wire.read_frame(reader))
+
+
+@pytest.mark.parametrize("wire", [
+    codec.JsonCodec(),
+    pytest.param(codec.OrjsonCodec(), marks=needs_orjson),
+    pytest.param(codec.MsgpackCodec(), marks=needs_msgpack),
+])
+async def test_round_trip(wire):
+    decoded = await _read_back(wire, wire.encode(MESSAGE))
+    assert decoded["command"] == "spawn_actors"
+    np.testing.assert_allclose(decoded["params"]["transforms"], MESSAGE["params"]["transforms"])
+
+
+@needs_orjson
+def test_json_codecs_are_identical_on_the_wire():
+    message = {"command": "get_scene_info", "params": {"query": "cube", "n": 3}}
+    assert codec.JsonCodec().decode(codec.OrjsonCodec().encode(message)) == message
+    assert codec.OrjsonCodec().encode(message).endswith(b"\n")
+
+
+@needs_msgpack
+def test_msgpack_frames_are_distinguishable_from_json():
+    assert codec.is_msgpack_frame(codec.MsgpackCodec().encode(MESSAGE)[:1])
+    assert not codec.is_msgpack_frame(codec.JsonCodec().encode(MESSAGE)[:1])
+
+
+@needs_msgpack
+def test_msgpack_packs_transforms_as_binary():
+    transforms = np.zeros((1000, 9))
+    packed = codec.MsgpackCodec().encode({"transforms": transforms})
+    # 4 bytes per value, one offset per column, plus small headers
+    assert len(packed) < 1000 * 9 * 4 + 9 * 8 + 64
+
+
+@needs_msgpack
+@pytest.mark.parametrize("transforms", [
+    np.array([[1 / 3, 2.0], [0.5, 0.25]]),  # not on the 1e-3 grid
+    np.array([[0.0], [5e6]]),  # spans more than int32 at 1e-3
+    np.arange(6.0),  # not 2-D
+])
+async def test_msgpack_falls_back_to_float64_losslessly(transforms):
+    decoded = await _read_back(codec.MsgpackCodec(), codec.MsgpackCodec().encode({"transforms": transforms}))
+    np.testing.assert_array_equal(decoded["transforms"], transforms)
+
+
+@needs_msgpack
+async def test_msgpack_keeps_large_world_precision():
+    transforms = np.array([[1_234_567.125, -987_654.375, 20_000.001, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0]])
+    decoded = await _read_back(codec.MsgpackCodec(), codec.MsgpackCodec().encode({"transforms": transforms}))
+    np.testing.assert_array_equal(decoded["transforms"], transforms)
+
+
+@pytest.fixture
+def fresh_negotiation():
+    with patch("mcp_server.server._wire_codec", None), \
+         patch("mcp_server.server.breaker", CircuitBreaker()):
+        yield
+
+
+@needs_msgpack
+async def test_negotiates_msgpack(fresh_negotiation):
+    async with FakeUEServer() as fake:
+        with patch("mcp_server.server.UE_TCP_PORT", fake.port):
+            result = await server.send_command("spawn_actors", MESSAGE["params"])
+            assert result["success"] is True
+            assert len(result["actor_ids"]) == 4
+            assert server._wire_codec.name == "msgpack"
+
+            # Negotiation happens once per process
+            await server.send_command("get_scene_info")
+            commands = [c["command"] for c in fake.commands]
+            assert commands == ["negotiate_codec", "spawn_actors", "get_scene_info"]
+            assert fake.actors["StaticMeshActor_1"]["transform"]["rotation"]["yaw"] == 90.0
+
+
+async def test_falls_back_to_json_for_old_plugin(fresh_negotiation):
+    async with FakeUEServer(codecs=()) as fake:
+        with patch("mcp_server.server.UE_TCP_PORT", fake.port):
+            result = await server.send_command("spawn_actors", MESSAGE["params"])
+            assert result["success"] is True
+            assert server._wire_codec.name == "json"
+
+
+async def test_json_only_skips_negotiation(fresh_negotiation):
+    async with FakeUEServer() as fake:
+        with patch("mcp_server.server.UE_TCP_PORT", fake.port), \
+             patch("mcp_server.server.UE_TCP_CODECS", ["json"]):
+            await server.send_command("get_scene_info")
+            assert [c["command"] for c in fake.commands] == ["get_scene_info"]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 from fastmcp import Client
 
@@ -25,6 +26,14 @@ def _mock_send_command(command: str, params: dict | None = None) -> dict:  # noq
                 "z": params.get("z", 0) if params else 0,
             },
         }
+    elif command == "spawn_actors":
+        actor_type = params.get("actor_type", "Unknown") if params else "Unknown"
+        transforms = params.get("transforms", []) if params else []
+        return {
+            "success": True,
+            "actor_type": actor_type,
+            "actor_ids": [f"{actor_type}_{i}" for i in range(len(transforms))],
+        }
     elif command == "get_scene_info":
         return {"success": True, "actors": []}
     elif command == "delete_actor":
@@ -374,3 +383,153 @@ async def test_set_light_intensity_high(mock_tcp):
         "actor_id": "SpotLight_1",
         "intensity": 5.0,
     })
+
+
+@pytest.mark.asyncio
+async def test_place_grid(mock_tcp):
+    async with Client(mcp) as client:
+        result = await client.call_tool("place_grid", {
+            "actor_type": "StaticMeshActor",
+            "rows": 2,
+            "cols": 3,
+            "spacing_x": 100.0,
+            "spacing_y": 200.0,
+        })
+        data = json.loads(result.content[0].text)
+        assert data["success"] is True
+        assert data["requested"] == 6
+        assert data["spawned"] == 6
+
+    mock_tcp.assert_called_once()
+    command, params = mock_tcp.call_args.args
+    assert command == "spawn_actors"
+    assert params["actor_type"] == "StaticMeshActor"
+    transforms = params["transforms"].tolist()
+    assert transforms[0] == [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+    assert transforms[5][:3] == [200.0, 200.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_place_scatter_batches(mock_tcp):
+    with patch("mcp_server.server.UE_SPAWN_BATCH_SIZE", 400):
+        async with Client(mcp) as client:
+            result = await client.call_tool("place_scatter", {
+                "actor_type": "StaticMeshActor",
+                "count": 1000,
+                "center_x": 0.0,
+                "center_y": 0.0,
+                "center_z": 0.0,
+                "extent_x": 10000.0,
+                "extent_y": 10000.0,
+                "min_spacing": 100.0,
+                "seed": 42,
+            })
+            data = json.loads(result.content[0].text)
+            assert data["success"] is True
+            assert data["spawned"] == 1000
+            assert data["batches"] == 3
+            assert len(data["actor_ids_sample"]) == 10
+
+    assert mock_tcp.call_count == 3
+    sizes = sorted(len(call.args[1]["transforms"]) for call in mock_tcp.call_args_list)
+    assert sizes == [200, 400, 400]
+
+
+@pytest.mark.asyncio
+async def test_place_scatter_reports_shortfall(mock_tcp):
+    async with Client(mcp) as client:
+        result = await client.call_tool("place_scatter", {
+            "actor_type": "Rock",
+            "count": 10000,
+            "center_x": 0.0,
+            "center_y": 0.0,
+            "center_z": 0.0,
+            "extent_x": 500.0,
+            "extent_y": 500.0,
+            "min_spacing": 60.0,
+            "seed": 1,
+        })
+        data = json.loads(result.content[0].text)
+
+    assert data["success"] is False
+    assert data["requested"] == 10000
+    assert 0 < data["spawned"] < 1000
+    assert f"Only {data['spawned']} of 10000" in data["warning"]
+
+
+@pytest.mark.asyncio
+async def test_place_scatter_jitter_is_independent_of_position(mock_tcp):
+    async with Client(mcp) as client:
+        await client.call_tool("place_scatter", {
+            "actor_type": "Rock",
+            "count": 400,
+            "center_x": 0.0,
+            "center_y": 0.0,
+            "center_z": 0.0,
+            "extent_x": 5000.0,
+            "extent_y": 5000.0,
+            "scale_min": 0.5,
+            "scale_max": 2.0,
+            "seed": 3,
+        })
+
+    transforms = mock_tcp.call_args.args[1]["transforms"]
+    x, yaw, scale = transforms[:, 0], transforms[::2, 4], transforms[::2, 6]
+    # With one shared stream, actor 2i's yaw was a linear function of actor i's
+    # x, and its scale a linear function of actor 200+i's x
+    assert abs(np.corrcoef(x[:200], yaw)[0, 1]) < 0.3
+    assert abs(np.corrcoef(x[200:], scale)[0, 1]) < 0.3
+
+
+@pytest.mark.asyncio
+async def test_place_circle_face_center(mock_tcp):
+    async with Client(mcp) as client:
+        result = await client.call_tool("place_circle", {
+            "actor_type": "PointLight",
+            "count": 4,
+            "center_x": 0.0,
+            "center_y": 0.0,
+            "center_z": 100.0,
+            "radius": 500.0,
+            "face_center": True,
+        })
+        data = json.loads(result.content[0].text)
+        assert data["spawned"] == 4
+
+    transforms = mock_tcp.call_args.args[1]["transforms"].tolist()
+    # First actor sits on +X and faces back towards the origin
+    assert transforms[0][:3] == [500.0, 0.0, 100.0]
+    assert transforms[0][4] == 180.0
+
+
+@pytest.mark.asyncio
+async def test_place_along_path(mock_tcp):
+    async with Client(mcp) as client:
+        result = await client.call_tool("place_along_path", {
+            "actor_type": "StaticMeshActor",
+            "count": 3,
+            "path_points": [[0.0, 0.0, 0.0], [0.0, 1000.0, 0.0]],
+        })
+        data = json.loads(result.content[0].text)
+        assert data["spawned"] == 3
+
+    transforms = mock_tcp.call_args.args[1]["transforms"].tolist()
+    assert [t[1] for t in transforms] == [0.0, 500.0, 1000.0]
+    assert all(t[4] == 90.0 for t in transforms)
+
+
+@pytest.mark.asyncio
+async def test_place_reports_failed_batches(mock_tcp):
+    mock_tcp.side_effect = lambda command, params=None: {"success": False, "error": "Unknown actor type: Tree"}
+    async with Client(mcp) as client:
+        result = await client.call_tool("place_grid", {
+            "actor_type": "Tree",
+            "rows": 1,
+            "cols": 2,
+            "spacing_x": 100.0,
+            "spacing_y": 100.0,
+        })
+        data = json.loads(result.content[0].text)
+        assert data["success"] is False
+        assert data["spawned"] == 0
+        assert data["errors"] == ["Unknown actor type: Tree"]
@@ -0,0 +1,80 @@
+"""Tests for the vectorised bulk placement generators."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mcp_server import placement
+
+
+def test_grid_layout():
+    locations = placement.grid(2, 3, 100.0, 50.0, origin=(10.0, 20.0, 30.0))
+    assert locations.shape == (6, 3)
+    assert locations[0].tolist() == [10.0, 20.0, 30.0]
+    assert locations[2].tolist() == [210.0, 20.0, 30.0]
+    assert locations[3].tolist() == [10.0, 70.0, 30.0]
+
+
+def test_circle_radius():
+    locations = placement.circle(200, (100.0, -50.0, 5.0), 1000.0)
+    assert locations.shape == (200, 3)
+    radii = np.hypot(locations[:, 0] - 100.0, locations[:, 1] + 50.0)
+    np.testing.assert_allclose(radii, 1000.0)
+    assert np.all(locations[:, 2] == 5.0)
+
+
+def test_scatter_respects_min_spacing_and_bounds():
+    locations = placement.scatter(2000, (0.0, 0.0, 0.0), 10000.0, 10000.0, min_spacing=150.0, seed=7)
+    assert locations.shape == (2000, 3)
+    assert np.all(np.abs(locations[:, :2]) <= 10000.0)
+
+    diff = locations[:, None, :2] - locations[None, :, :2]
+    dist = np.sqrt(np.sum(diff ** 2, axis=-1))
+    np.fill_diagonal(dist, np.inf)
+    assert dist.min() >= 150.0
+
+
+def test_scatter_is_deterministic_for_seed():
+    a = placement.scatter(500, (0.0, 0.0, 0.0), 5000.0, 5000.0, min_spacing=100.0, seed=3)
+    b = placement.scatter(500, (0.0, 0.0, 0.0), 5000.0, 5000.0, min_spacing=100.0, seed=3)
+    np.testing.assert_array_equal(a, b)
+
+
+def test_scatter_returns_fewer_when_area_is_full():
+    locations = placement.scatter(1000, (0.0, 0.0, 0.0), 500.0, 500.0, min_spacing=200.0, seed=1)
+    assert 0 < len(locations) < 1000
+
+
+def test_along_path_polyline_spacing_and_yaw():
+    locations, yaw = placement.along_path(
+        [[0.0, 0.0, 0.0], [1000.0, 0.0, 0.0], [1000.0, 1000.0, 0.0]], 5, smooth=False,
+    )
+    np.testing.assert_allclose(locations[:, 0], [0.0, 500.0, 1000.0, 1000.0, 1000.0])
+    np.testing.assert_allclose(locations[:, 1], [0.0, 0.0, 0.0, 500.0, 1000.0])
+    np.testing.assert_allclose(yaw, [0.0, 0.0, 90.0, 90.0, 90.0])
+
+
+def test_along_path_smooth_passes_through_endpoints():
+    points = [[0.0, 0.0, 0.0], [500.0, 500.0, 0.0], [1000.0, 0.0, 100.0]]
+    locations, _ = placement.along_path(points, 50)
+    np.testing.assert_allclose(locations[0], points[0])
+    np.testing.assert_allclose(locations[-1], points[-1])
+
+
+def test_along_path_rejects_single_point():
+    with pytest.raises(ValueError):
+        placement.along_path([[0.0, 0.0, 0.0]], 10)
+
+
+def test_make_transforms_jitter_ranges():
+    locations = placement.grid(10, 10, 100.0, 100.0)
+    transforms = placement.make_transforms(
+        locations, yaw=90.0, yaw_jitter=15.0, scale_min=0.5, scale_max=2.0, seed=11,
+    )
+    assert transforms.shape == (100, 9)
+    np.testing.assert_array_equal(transforms[:, :3], locations)
+    assert np.all((transforms[:, 4] >= 75.0) & (transforms[:, 4] <= 105.0))
+    assert np.all((transforms[:, 6] >= 0.5) & (transforms[:, 6] <= 2.0))
+    np.testing.assert_array_equal(transforms[:, 6], transforms[:, 8])
+    assert np.all(transforms[:, [3, 5]] == 0.0)
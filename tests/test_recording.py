@@ -0,0 +1,141 @@
+"""Tests for session recording and offline replay."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.apps import App
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from agents.recording import ReplayLlm, ReplayPlugin, SessionRecorder, load_recording
+from main import USER_ID, TurnPrinter, run_turn
+from mcp_server import server
+from mcp_server.fake_ue import FakeUEServer, ReplayUEServer
+
+SSE = RunConfig(streaming_mode=StreamingMode.SSE)
+renders: list[str] = []
+
+
+def render_image(prompt: str) -> str:
+    """Render an image (stands in for a tool that calls an external API)."""
+    renders.append(prompt)
+    return f"/images/{len(renders)}.png"
+
+
+class FakeLlm(BaseLlm):
+    """Calls render_image, then streams a reply naming the result."""
+
+    model: str = "fake"
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        last = llm_request.contents[-1].parts[0]
+        if last.function_response is None:
+            call = types.FunctionCall(name="render_image", args={"prompt": last.text})
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+            return
+        reply = ["Saved ", last.function_response.response["result"]]
+        if stream:
+            for chunk in reply:
+                yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=chunk)]), partial=True)
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="".join(reply))]))
+
+
+async def _session(model: BaseLlm, plugins: list, messages: list[str], instruction: str = "Draw.") -> str:
+    agent = LlmAgent(name="artist", model=model, instruction=instruction, tools=[render_image])
+    runner = Runner(app=App(name="test", root_agent=agent, plugins=plugins), session_service=InMemorySessionService())
+    session = await runner.session_service.create_session(app_name="test", user_id=USER_ID)
+    out = io.StringIO()
+    printer = TurnPrinter(out)
+    for message in messages:
+        await run_turn(runner, session.id, message, printer, SSE)
+    return out.getvalue()
+
+
+async def test_replay_reproduces_recorded_session(tmp_path):
+    renders.clear()
+    recorded_output = await _session(FakeLlm(), [SessionRecorder(tmp_path, streaming=True)], ["a cat", "a dog"])
+    assert len(renders) == 2
+
+    recording = load_recording(tmp_path)
+    assert recording.streaming is True
+    assert [turn.input for turn in recording.turns] == ["a cat", "a dog"]
+    assert [turn.model_calls for turn in recording.turns] == [2, 2]
+    assert [tool["response"] for tool in recording.tools] == [{"result": "/images/1.png"}, {"result": "/images/2.png"}]
+    # Partial responses are kept, for streaming replays
+    assert [len(call["responses"]) for call in recording.llm_calls] == [1, 3, 1, 3]
+    assert recording.llm_calls[0]["request"]["config"]["system_instruction"].startswith("Draw.")
+
+    model = ReplayLlm(calls=recording.llm_calls)
+    replayed_output = await _session(model, [ReplayPlugin(recording.tools)], ["a cat", "a dog"])
+
+    assert replayed_output == recorded_output
+    assert len(renders) == 2  # the tool's results came from the recording
+    assert model.divergences == 0
+
+
+async def test_replay_counts_changed_requests(tmp_path):
+    await _session(FakeLlm(), [SessionRecorder(tmp_path, streaming=True)], ["a cat"])
+    recording = load_recording(tmp_path)
+
+    model = ReplayLlm(calls=recording.llm_calls)
+    await _session(model, [ReplayPlugin(recording.tools)], ["a cat"], instruction="Paint.")
+    assert model.divergences == 2
+
+
+async def test_recording_again_replaces_earlier_session(tmp_path):
+    (tmp_path / "tcp.jsonl").write_text('{"command": "get_scene_info"}\n')
+    await _session(FakeLlm(), [SessionRecorder(tmp_path, streaming=True)], ["a cat", "a dog"])
+    await _session(FakeLlm(), [SessionRecorder(tmp_path, streaming=True)], ["a bird"])
+
+    recording = load_recording(tmp_path)
+    assert [turn.input for turn in recording.turns] == ["a bird"]
+    assert [turn.model_calls for turn in recording.turns] == [2]
+    assert recording.exchanges == []
+
+
+async def test_replay_reports_exhausted_recording(tmp_path):
+    await _session(FakeLlm(), [SessionRecorder(tmp_path, streaming=True)], ["a cat"])
+    recording = load_recording(tmp_path)
+
+    model = ReplayLlm(calls=recording.llm_calls)
+    await _session(model, [ReplayPlugin(recording.tools)], ["a cat", "one more"])
+    assert model.position == len(recording.llm_calls)
+
+
+def test_replay_server_answers_in_recorded_order():
+    fake = ReplayUEServer([
+        {"command": "spawn_actor", "response": {"success": True, "actor_id": "Tree_7"}},
+        {"command": "spawn_actor", "error": "TimeoutError()"},
+        {"command": "spawn_actor", "response": {"success": True, "actor_id": "Tree_8"}},
+    ])
+    params = {"actor_type": "Tree", "location": [0, 0, 0]}
+
+    assert fake.handle_command("spawn_actor", params)["actor_id"] == "Tree_7"
+    assert fake.handle_command("spawn_actor", params)["actor_id"] == "Tree_8"
+    # Beyond the recording, the in-memory scene answers
+    assert fake.handle_command("spawn_actor", params)["actor_id"] == "Tree_1"
+    assert fake.unmatched == 1
+
+
+async def test_send_command_records_exchanges(tmp_path):
+    path = tmp_path / "tcp.jsonl"
+    async with FakeUEServer() as fake:
+        with patch.object(server, "UE_TCP_PORT", fake.port), \
+             patch.object(server, "UE_TCP_CODECS", ["json"]), \
+             patch.object(server, "UE_TCP_RECORD", str(path)):
+            await server.send_command("spawn_actor", {"actor_type": "PointLight", "x": 0, "y": 0, "z": 1})
+
+    (record,) = [json.loads(line) for line in path.read_text().splitlines()]
+    assert record["command"] == "spawn_actor"
+    assert record["response"]["actor_id"] == "PointLight_1"
+    assert record["elapsed"] >= 0
@@ -0,0 +1,116 @@
+"""Tests for the REPL's streaming display, with a fake streaming model."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import re
+from typing import AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from main import USER_ID, TurnPrinter, _tool_error, run_turn
+
+REPLY = ["Spawned ", "a point light ", "at the origin."]
+
+
+class FakeStreamingLlm(BaseLlm):
+    """Calls one tool, then replies in chunks when streaming is requested."""
+
+    model: str = "fake-streaming"
+    tool: str = "spawn_actor"
+    chunk_delay: float = 0.05
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if not any(part.function_response for part in llm_request.contents[-1].parts or []):
+            call = types.FunctionCall(name=self.tool, args={"actor_type": "PointLight"})
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+            return
+
+        for chunk in REPLY:
+            await asyncio.sleep(self.chunk_delay)
+            if stream:
+                yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=chunk)]), partial=True)
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="".join(REPLY))]))
+
+
+async def spawn_actor(actor_type: str) -> dict:
+    """Spawn an actor."""
+    await asyncio.sleep(0.05)
+    return {"success": True, "actor_id": f"{actor_type}_1"}
+
+
+async def delete_actor(actor_type: str) -> dict:
+    """Delete an actor."""
+    return {"success": False, "error": "Actor not found"}
+
+
+async def _turn(stream: bool, tool: str = "spawn_actor"):
+    agent = LlmAgent(name="editor", model=FakeStreamingLlm(tool=tool), tools=[spawn_actor, delete_actor])
+    runner = Runner(app_name="test", agent=agent, session_service=InMemorySessionService())
+    session = await runner.session_service.create_session(app_name="test", user_id=USER_ID)
+    out = io.StringIO()
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE)
+    timing = await run_turn(runner, session.id, "add a light", TurnPrinter(out), run_config)
+    return out.getvalue().splitlines(), timing
+
+
+async def test_streams_reply_once_with_tool_progress():
+    lines, timing = await _turn(stream=True)
+
+    assert lines[0] == "  ... spawn_actor(actor_type='PointLight')"
+    assert re.fullmatch(r"  ok  spawn_actor \(0\.\d\ds\)", lines[1])
+    assert lines[2:] == ["".join(REPLY)]
+    assert timing.first_output < timing.first_text < timing.total
+
+
+async def test_streaming_shows_text_sooner():
+    _, streamed = await _turn(stream=True)
+    _, complete = await _turn(stream=False)
+
+    # Streaming shows the first chunk; otherwise the reply waits for all three
+    assert streamed.first_text < complete.first_text - 0.05
+
+
+async def test_reports_failed_tool():
+    lines, _ = await _turn(stream=True, tool="delete_actor")
+    assert re.fullmatch(r"  err delete_actor \(0\.\d\ds\): Actor not found", lines[1])
+
+
+def test_mcp_tool_errors_are_read_from_structured_content():
+    result = {"content": [], "structuredContent": {"success": False, "error": "Actor not found"}, "isError": False}
+    assert _tool_error(result) == "Actor not found"
+    assert _tool_error({"content": [], "structuredContent": {"success": True}, "isError": False}) is None
+    assert _tool_error({"content": [], "isError": True}) == "failed"
+
+
+def test_mcp_tool_exceptions_are_read_from_text_content():
+    result = {
+        "content": [{"type": "text", "text": "Error calling tool 'place_grid': rows and cols must be at least 1"}],
+        "isError": True,
+    }
+    assert _tool_error(result) == "Error calling tool 'place_grid': rows and cols must be at least 1"
+
+
+def test_turn_timings_are_recorded():
+    # Clock reads: two turn starts, first chunk, end of line, end of turn
+    clock = iter([0.0, 0.0, 0.4, 0.5, 1.0]).__next__
+    out = io.StringIO()
+    printer = TurnPrinter(out, clock=clock)
+    printer.start_turn()
+    content = types.Content(role="model", parts=[types.Part(text="hi")])
+    printer.handle(Event(author="editor", content=content, partial=True))
+    printer.handle(Event(author="editor", content=content))
+    timing = printer.end_turn()
+
+    assert (timing.first_output, timing.first_text, timing.total) == (0.4, 0.4, 1.0)
+    assert printer.turns == [timing]
+    assert out.getvalue() == "hi\n"
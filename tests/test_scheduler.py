@@ -0,0 +1,90 @@
+"""Tests for fair turn scheduling across sessions."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from service.scheduler import FairScheduler
+
+
+async def _run_turns(scheduler: FairScheduler, turns: list[str], order: list[str], hold: float = 0.01):
+    async def turn(session_id: str) -> None:
+        async with scheduler.turn(session_id):
+            order.append(session_id)
+            await asyncio.sleep(hold)
+
+    tasks = []
+    for session_id in turns:
+        tasks.append(asyncio.create_task(turn(session_id)))
+        await asyncio.sleep(0)  # enqueue in submission order
+    await asyncio.gather(*tasks)
+
+
+async def test_round_robin_between_sessions():
+    scheduler = FairScheduler(max_concurrent_turns=1)
+    order: list[str] = []
+    await _run_turns(scheduler, ["a", "a", "a", "a", "b", "c"], order)
+    # a's backlog doesn't starve b and c
+    assert order == ["a", "b", "c", "a", "a", "a"]
+
+
+async def test_one_turn_per_session_at_a_time():
+    scheduler = FairScheduler(max_concurrent_turns=4)
+    running: set[str] = set()
+    overlaps = 0
+
+    async def turn(session_id: str) -> None:
+        nonlocal overlaps
+        async with scheduler.turn(session_id):
+            if session_id in running:
+                overlaps += 1
+            running.add(session_id)
+            await asyncio.sleep(0.01)
+            running.discard(session_id)
+
+    await asyncio.gather(*(turn(sid) for sid in ["a", "a", "a", "b", "b"]))
+    assert overlaps == 0
+
+
+async def test_global_limit():
+    scheduler = FairScheduler(max_concurrent_turns=3)
+    peak = 0
+
+    async def turn(session_id: str) -> None:
+        nonlocal peak
+        async with scheduler.turn(session_id):
+            peak = max(peak, scheduler.running)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(turn(f"s{i}") for i in range(10)))
+    assert peak == 3
+    assert scheduler.running == 0
+    assert scheduler.waiting == 0
+
+
+async def test_cancelled_waiter_releases_its_place():
+    scheduler = FairScheduler(max_concurrent_turns=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def turn(session_id: str) -> None:
+        async with scheduler.turn(session_id):
+            order.append(session_id)
+            await release.wait()
+
+    first = asyncio.create_task(turn("a"))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(turn("b"))
+    after = asyncio.create_task(turn("c"))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    release.set()
+    await asyncio.gather(first, after)
+
+    assert order == ["a", "c"]
+    assert scheduler.waiting == 0
@@ -0,0 +1,190 @@
+"""Tests for send_command deadlines, retries, cancellation and circuit breaking.
+
+These run against the in-process stand-in plugin in ``mcp_server.fake_ue``,
+pinned to the json codec so scripted faults hit the command under test
+rather than codec negotiation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server import server
+from mcp_server.circuit_breaker import CircuitBreaker
+from mcp_server.fake_ue import FakeUEServer, FaultConfig
+
+
+@pytest.fixture(autouse=True)
+def json_codec():
+    with patch("mcp_server.server.UE_TCP_CODECS", ["json"]), \
+         patch("mcp_server.server._wire_codec", None):
+        yield
+
+
+@pytest.fixture
+async def fake_ue():
+    async with FakeUEServer(faults=FaultConfig(stall_seconds=5.0)) as fake:
+        with patch("mcp_server.server.UE_TCP_PORT", fake.port), \
+             patch("mcp_server.server.breaker", CircuitBreaker(3, 0.2)):
+            yield fake
+
+
+async def _unused_port() -> int:
+    probe = await FakeUEServer().start()
+    await probe.stop()
+    return probe.port
+
+
+async def test_round_trip(fake_ue):
+    spawned = await server.send_command("spawn_actor", {"actor_type": "PointLight", "x": 1.0})
+    assert spawned["success"] is True
+    assert spawned["actor_id"] == "PointLight_1"
+
+    scene = await server.send_command("get_scene_info")
+    assert [a["actor_id"] for a in scene["actors"]] == ["PointLight_1"]
+
+
+async def test_stalled_command_times_out(fake_ue):
+    fake_ue.faults.script = deque(["stall"])
+    start = time.perf_counter()
+    result = await server.send_command("delete_actor", {"actor_id": "Cube_1"}, timeout=0.2)
+    elapsed = time.perf_counter() - start
+
+    assert result["success"] is False
+    assert "Timed out" in result["error"]
+    assert elapsed < 0.5
+
+
+async def test_heavy_commands_get_longer_default_deadline(fake_ue):
+    fake_ue.faults.script = deque(["stall"])
+    fake_ue.faults.stall_seconds = 0.3
+    with patch("mcp_server.server.UE_TCP_TIMEOUT", 0.1), \
+         patch("mcp_server.server.UE_TCP_HEAVY_TIMEOUT", 2.0):
+        result = await server.send_command("import_asset", {"file_path": "/tmp/a.png", "asset_name": "a"})
+    assert result["success"] is True
+
+
+async def test_idempotent_read_is_retried(fake_ue):
+    fake_ue.faults.script = deque(["drop", "drop"])
+    result = await server.send_command("get_scene_info")
+    assert result["success"] is True
+    assert fake_ue.connections == 3
+
+
+async def test_write_is_not_retried(fake_ue):
+    fake_ue.faults.script = deque(["drop"])
+    result = await server.send_command("spawn_actor", {"actor_type": "PointLight"})
+    assert result["success"] is False
+    assert "Could not reach UE plugin" in result["error"]
+    assert fake_ue.connections == 1
+    assert fake_ue.actors == {}
+
+
+async def test_circuit_breaker_fails_fast_then_recovers():
+    port = await _unused_port()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.2)
+    with patch("mcp_server.server.UE_TCP_PORT", port), patch("mcp_server.server.breaker", breaker):
+        for _ in range(3):
+            result = await server.send_command("delete_actor", {"actor_id": "a"})
+            assert "Could not reach UE plugin" in result["error"]
+        assert breaker.state == "open"
+
+        result = await server.send_command("delete_actor", {"actor_id": "a"})
+        assert "unreachable" in result["error"]
+
+        await asyncio.sleep(0.25)
+        async with FakeUEServer(port=port) as fake:
+            result = await server.send_command("get_scene_info")
+            assert result["success"] is True
+            assert fake.connections == 1
+        assert breaker.state == "closed"
+
+
+async def test_cancellation_aborts_connection(fake_ue):
+    fake_ue.faults.script = deque(["stall"])
+    task = asyncio.create_task(server.send_command("get_scene_info"))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert time.perf_counter() - start < 0.1
+    # Cancellation is not a plugin failure
+    assert server.breaker.state == "closed"
+
+
+async def test_waiting_for_a_connection_is_not_part_of_the_deadline(fake_ue):
+    fake_ue.faults.latency = 0.1
+    with patch("mcp_server.server.UE_TCP_MAX_CONCURRENCY", 1):
+        # Eight sessions at once: the last waits 0.7s for the only connection
+        results = await asyncio.gather(*(
+            server.send_command("get_scene_info", timeout=0.3) for _ in range(8)
+        ))
+    assert all(result["success"] for result in results)
+    assert server.breaker.state == "closed"
+
+
+async def test_queue_timeout_does_not_open_breaker(fake_ue):
+    fake_ue.faults.latency = 0.2
+    with patch("mcp_server.server.UE_TCP_MAX_CONCURRENCY", 1), \
+         patch("mcp_server.server.UE_TCP_QUEUE_TIMEOUT", 0.1):
+        results = await asyncio.gather(*(server.send_command("get_scene_info") for _ in range(5)))
+    assert results[0]["success"] is True
+    assert all("free connection" in result["error"] for result in results[1:])
+    assert server.breaker.state == "closed"
+
+
+async def test_busy_plugin_does_not_open_breaker(fake_ue):
+    # The single-client plugin answers one connection at a time; the others
+    # time out in its listen backlog while it keeps answering
+    fake_ue.faults.latency = 0.2
+    results = await asyncio.gather(*(server.send_command("get_scene_info", timeout=0.3) for _ in range(4)))
+    assert results[0]["success"] is True
+    assert all("Timed out" in result["error"] for result in results[1:])
+    assert server.breaker.state == "closed"
+
+    assert (await server.send_command("get_scene_info"))["success"] is True
+
+
+async def test_oversize_command_is_not_a_transport_failure(fake_ue):
+    with patch("mcp_server.server.UE_TCP_CODECS", ["msgpack", "json"]), \
+         patch("mcp_server.server.breaker", CircuitBreaker(1, 60.0)):
+        assert (await server.send_command("get_scene_info"))["success"] is True
+        connections = fake_ue.connections
+        with patch("mcp_server.codec.MAX_FRAME_SIZE", 64):
+            result = await server.send_command("search_actors", {"query": "x" * 100})
+
+        assert result["success"] is False
+        assert "could not encode" in result["error"]
+        # Neither sent, retried nor counted against the breaker
+        assert fake_ue.connections == connections
+        assert server.breaker.state == "closed"
+        assert (await server.send_command("get_scene_info"))["success"] is True
+
+
+async def test_tail_latency_is_bounded_under_faults():
+    """Stalls hold up the single-client plugin; deadlines cap latency without failing everything."""
+    faults = FaultConfig(latency=0.001, stall_rate=0.1, stall_seconds=0.3, seed=5)
+    async with FakeUEServer(faults=faults) as fake:
+        with patch("mcp_server.server.UE_TCP_PORT", fake.port), \
+             patch("mcp_server.server.breaker", CircuitBreaker(3, 0.2)):
+            deadline = 0.1
+            latencies = []
+            succeeded = 0
+            for _ in range(60):
+                start = time.perf_counter()
+                result = await server.send_command("get_scene_info", timeout=deadline)
+                latencies.append(time.perf_counter() - start)
+                succeeded += result["success"]
+                # Paced like a client, so the plugin and breaker can recover
+                await asyncio.sleep(0.02)
+
+    assert max(latencies) < deadline + 0.1
+    # Failing fast on everything would also bound latency
+    assert succeeded >= 40
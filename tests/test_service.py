@@ -0,0 +1,154 @@
+"""Tests for the multi-session HTTP/WebSocket service, with a stub model."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import AsyncGenerator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from google.adk.agents import LlmAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from service.app import AgentService, create_app
+from service.scheduler import FairScheduler
+
+
+class FailingLlm(BaseLlm):
+    """Raises, like a model call that fails with a network error."""
+
+    model: str = "failing"
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        raise ConnectionError("model unavailable")
+        yield
+
+
+class EchoLlm(BaseLlm):
+    """Replies to the latest user message after a fixed delay."""
+
+    model: str = "echo"
+    delay: float = 0.0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        await asyncio.sleep(self.delay)
+        text = llm_request.contents[-1].parts[0].text
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=f"echo: {text}")]))
+
+
+def _service(delay: float = 0.0, max_turns: int = 8, model: BaseLlm | None = None, **kwargs) -> AgentService:
+    agent = LlmAgent(name="echo", model=model or EchoLlm(delay=delay), instruction="Echo the user.")
+    runner = Runner(app_name="test", agent=agent, session_service=InMemorySessionService())
+    return AgentService(runner, FairScheduler(max_turns), **kwargs)
+
+
+@pytest.fixture
+def client():
+    transport = httpx.ASGITransport(app=create_app(_service()))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def test_turn_streams_ndjson_events(client):
+    async with client:
+        session_id = (await client.post("/sessions", json={})).json()["session_id"]
+        response = await client.post(f"/sessions/{session_id}/turns", json={"message": "hello"})
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0]["text"] == "echo: hello"
+    assert events[0]["final"] is True
+    assert events[-1]["type"] == "turn_complete"
+
+
+async def test_unknown_session_is_404(client):
+    async with client:
+        response = await client.post("/sessions/nope/turns", json={"message": "hello"})
+    assert response.status_code == 404
+
+
+async def test_sessions_share_the_turn_limit():
+    service = _service(delay=0.05, max_turns=4)
+    sessions = [await service.create_session("user") for _ in range(8)]
+
+    async def turn(session_id: str) -> list[dict]:
+        return [payload async for payload in service.run_turn(session_id, "hi")]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(turn(sid) for sid in sessions))
+    elapsed = time.perf_counter() - start
+
+    assert all(events[0]["text"] == "echo: hi" for events in results)
+    # Eight turns, four at a time: two rounds of the model delay
+    assert 0.1 <= elapsed < 0.5
+
+
+def test_websocket_turns():
+    with TestClient(create_app(_service())) as client:
+        session_id = client.post("/sessions", json={}).json()["session_id"]
+        with client.websocket_connect(f"/sessions/{session_id}/ws") as socket:
+            for message in ["one", "two"]:
+                socket.send_json({"message": message})
+                assert socket.receive_json()["text"] == f"echo: {message}"
+                assert socket.receive_json()["type"] == "turn_complete"
+
+
+def test_websocket_survives_bad_frames_and_failed_turns():
+    with TestClient(create_app(_service(model=FailingLlm()))) as client:
+        session_id = client.post("/sessions", json={}).json()["session_id"]
+        with client.websocket_connect(f"/sessions/{session_id}/ws") as socket:
+            socket.send_text("not json")
+            assert socket.receive_json()["type"] == "error"
+            socket.send_json({"text": "missing message"})
+            assert socket.receive_json()["type"] == "error"
+
+            socket.send_json({"message": "hello"})
+            reply = socket.receive_json()
+            assert reply == {"type": "error", "error": "ConnectionError: model unavailable"}
+
+
+async def test_failed_turn_ends_ndjson_stream_with_error():
+    transport = httpx.ASGITransport(app=create_app(_service(model=FailingLlm())))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        session_id = (await client.post("/sessions", json={})).json()["session_id"]
+        response = await client.post(f"/sessions/{session_id}/turns", json={"message": "hello"})
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1] == {"type": "error", "error": "ConnectionError: model unavailable"}
+
+
+async def test_delete_session(client):
+    async with client:
+        session_id = (await client.post("/sessions", json={})).json()["session_id"]
+        assert (await client.delete(f"/sessions/{session_id}")).status_code == 204
+        assert (await client.get("/stats")).json()["sessions"] == 0
+        assert (await client.delete(f"/sessions/{session_id}")).status_code == 404
+        response = await client.post(f"/sessions/{session_id}/turns", json={"message": "hello"})
+    assert response.status_code == 404
+
+
+async def test_idle_sessions_expire():
+    now = [0.0]
+    service = _service(idle_timeout=60.0, clock=lambda: now[0])
+    idle = await service.create_session("user")
+    active = await service.create_session("user")
+
+    now[0] = 50.0
+    [payload async for payload in service.run_turn(active, "hi")]
+    now[0] = 100.0
+    await service.create_session("user")
+
+    assert not service.has_session(idle)
+    assert service.has_session(active)
+    assert service.sessions == 2
+    session = await service.runner.session_service.get_session(app_name="test", user_id="user", session_id=idle)
+    assert session is None
@@ -0,0 +1,165 @@
+"""Tests for per-turn tool selection and prompt accounting."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import AsyncGenerator
+
+import pytest
+from fastmcp import Client
+from google.adk.agents import LlmAgent
+from google.adk.apps import App
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools import FunctionTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.genai import types
+
+from agents.prompt_stats import PromptStatsPlugin
+from agents.ue_editor.tool_selection import SelectiveToolset, ToolSelector
+from mcp_server.server import mcp
+
+
+@pytest.fixture
+async def ue_tools():
+    """Name/description pairs for the real MCP tools."""
+    async with Client(mcp) as client:
+        return [SimpleNamespace(name=t.name, description=t.description) for t in await client.list_tools()]
+
+
+def _names(tools) -> set[str]:
+    return {tool.name for tool in tools}
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Hide the cube", "set_visibility"),
+    ("Make the light dimmer", "set_light_intensity"),
+    ("Rotate the camera 90 degrees", "set_transform"),
+    ("Delete all the spheres", "delete_actor"),
+    ("Put 12 lamps in a ring around the statue", "place_circle"),
+    ("Plant a forest of 200 trees", "place_scatter"),
+    ("Line the road with lamp posts", "place_along_path"),
+    ("Apply the brick texture to the wall", "apply_material"),
+    ("Add a point light above the origin", "spawn_actor"),
+])
+async def test_selects_relevant_tool(ue_tools, message, expected):
+    selected = _names(ToolSelector().select(ue_tools, message))
+    assert expected in selected
+    assert {"search_actors", "get_scene_info"} <= selected
+    assert len(selected) <= len(ue_tools) // 2
+
+
+async def test_unmatched_message_gets_all_tools(ue_tools):
+    assert ToolSelector().select(ue_tools, "Do that again") == ue_tools
+
+
+@pytest.mark.parametrize("message, needed", [
+    ("Make the cube twice as big", "set_transform"),
+    ("Get rid of the sphere", "delete_actor"),
+])
+async def test_lookup_words_alone_do_not_narrow_selection(ue_tools, message, needed):
+    # "the cube", "get", "scene" match only the always-exposed lookup tools
+    assert needed in _names(ToolSelector().select(ue_tools, message))
+
+
+async def test_message_matching_only_lookup_tools_gets_all_tools(ue_tools):
+    assert ToolSelector().select(ue_tools, "Get rid of the sphere") == ue_tools
+
+
+def hide_actor(actor_id: str) -> dict:
+    """Hide an actor in the scene."""
+    return {"success": True}
+
+
+def import_asset(file_path: str) -> dict:
+    """Import an external file into the project as an asset."""
+    return {"success": True}
+
+
+class _StaticToolset(BaseToolset):
+    async def get_tools(self, readonly_context=None):
+        return [FunctionTool(hide_actor), FunctionTool(import_asset)]
+
+
+class _TextLlm(BaseLlm):
+    model: str = "text"
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="ok")]))
+
+
+async def _turn_stats(enabled: bool, message: str):
+    stats = PromptStatsPlugin()
+    toolset = SelectiveToolset(_StaticToolset(), ToolSelector(always_exposed=()), enabled=enabled)
+    agent = LlmAgent(name="editor", model=_TextLlm(), tools=[toolset])
+    app = App(name="test", root_agent=agent, plugins=[stats])
+    runner = Runner(app=app, session_service=InMemorySessionService())
+    session = await runner.session_service.create_session(app_name="test", user_id="u")
+    content = types.Content(role="user", parts=[types.Part(text=message)])
+    async for _ in runner.run_async(user_id="u", session_id=session.id, new_message=content):
+        pass
+    (turn,) = stats.turns.values()
+    return turn
+
+
+async def test_selection_shrinks_prompt():
+    full = await _turn_stats(False, "hide the cube")
+    selected = await _turn_stats(True, "hide the cube")
+
+    assert full.model_calls == selected.model_calls == 1
+    assert (full.max_tools, selected.max_tools) == (2, 1)
+    assert selected.prompt_bytes < full.prompt_bytes
+
+
+async def test_no_match_falls_back_to_full_set():
+    assert (await _turn_stats(True, "hello")).max_tools == 2
+
+
+class _CallingLlm(BaseLlm):
+    """Calls each tool in ``calls`` in turn, recording the tools it was offered."""
+
+    model: str = "calling"
+    calls: list[str] = []
+    offered: list[set[str]] = []
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.offered.append(set(llm_request.tools_dict))
+        step = len(self.offered) - 1
+        if step < len(self.calls):
+            part = types.Part(function_call=types.FunctionCall(name=self.calls[step], args={"file_path": "a.png"}))
+        else:
+            part = types.Part(text="done")
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+async def _run_calls(calls: list[str]) -> tuple[_CallingLlm, list[dict]]:
+    model = _CallingLlm(calls=calls, offered=[])
+    toolset = SelectiveToolset(_StaticToolset(), ToolSelector(always_exposed=()), enabled=True)
+    agent = LlmAgent(name="editor", model=model, tools=[toolset], on_tool_error_callback=toolset.on_tool_error)
+    runner = Runner(app=App(name="test", root_agent=agent), session_service=InMemorySessionService())
+    session = await runner.session_service.create_session(app_name="test", user_id="u")
+    content = types.Content(role="user", parts=[types.Part(text="hide the cube")])
+    responses = []
+    async for event in runner.run_async(user_id="u", session_id=session.id, new_message=content):
+        responses.extend(response.response for response in event.get_function_responses())
+    return model, responses
+
+
+async def test_call_to_hidden_tool_declares_full_set():
+    model, responses = await _run_calls(["import_asset", "import_asset"])
+
+    assert model.offered == [{"hide_actor"}, {"hide_actor", "import_asset"}, {"hide_actor", "import_asset"}]
+    assert "call it again" in responses[0]["error"]
+    assert responses[1] == {"success": True}
+
+
+async def test_call_to_unknown_tool_is_reported_to_model():
+    model, responses = await _run_calls(["launch_rocket"])
+
+    assert responses == [{"success": False, "error": "There is no tool named launch_rocket"}]
+    assert len(model.offered) == 2
@@ -143,7 +143,9 @@ uint32 FAgenticControlServer::Run()
 				continue;
 			}
 
-			Buffer.SetNumUninitialized(PendingDataSize);
+			// Reserve one extra byte for a null terminator; large payloads
+			// (e.g. spawn_actors batches) arrive across several reads.
+			Buffer.SetNumUninitialized(PendingDataSize + 1);
 			int32 BytesRead = 0;
 			ClientSocket->Recv(Buffer.GetData(), PendingDataSize, BytesRead);
 
@@ -151,6 +153,7 @@ uint32 FAgenticControlServer::Run()
 			{
 				break;
 			}
+			Buffer[BytesRead] = 0;
 
 			Accumulated += FString(UTF8_TO_TCHAR(reinterpret_cast<const char*>(Buffer.GetData())));
 
@@ -258,7 +261,13 @@ FString FAgenticControlServer::HandleCommand(const FString& JsonCommand)
 
 	const TSharedPtr<FJsonObject>* ParamsPtr = nullptr;
 
-	if (Command == TEXT("spawn_actor"))
+	if (Command == TEXT("negotiate_codec"))
+	{
+		// Only newline-delimited JSON is implemented here; clients offering
+		// msgpack fall back to it.
+		return TEXT("{\"success\":true,\"codec\":\"json\"}");
+	}
+	else if (Command == TEXT("spawn_actor"))
 	{
 		if (JsonObject->TryGetObjectField(TEXT("params"), ParamsPtr) && ParamsPtr)
 		{
@@ -266,6 +275,14 @@ FString FAgenticControlServer::HandleCommand(const FString& JsonCommand)
 		}
 		return TEXT("{\"success\":false,\"error\":\"Missing params for spawn_actor\"}");
 	}
+	else if (Command == TEXT("spawn_actors"))
+	{
+		if (JsonObject->TryGetObjectField(TEXT("params"), ParamsPtr) && ParamsPtr)
+		{
+			return HandleSpawnActors(*ParamsPtr);
+		}
+		return TEXT("{\"success\":false,\"error\":\"Missing params for spawn_actors\"}");
+	}
 	else if (Command == TEXT("get_scene_info"))
 	{
 		return HandleGetSceneInfo();
@@ -408,6 +425,130 @@ FString FAgenticControlServer::HandleSpawnActor(const TSharedPtr<FJsonObject>& P
 	return ResultJson;
 }
 
+// ---------------------------------------------------------------------------
+// spawn_actors — bulk spawn; each transform is
+// [x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z]
+// ---------------------------------------------------------------------------
+
+FString FAgenticControlServer::HandleSpawnActors(const TSharedPtr<FJsonObject>& Params)
+{
+	FString ActorType;
+	Params->TryGetStringField(TEXT("actor_type"), ActorType);
+
+	const TArray<TSharedPtr<FJsonValue>>* TransformValues = nullptr;
+	if (!Params->TryGetArrayField(TEXT("transforms"), TransformValues) || !TransformValues)
+	{
+		return TEXT("{\"success\":false,\"error\":\"Missing transforms for spawn_actors\"}");
+	}
+
+	// Parse transforms on this thread so the game thread only spawns
+	TArray<FTransform> Transforms;
+	Transforms.Reserve(TransformValues->Num());
+	for (const TSharedPtr<FJsonValue>& Value : *TransformValues)
+	{
+		const TArray<TSharedPtr<FJsonValue>>* Fields = nullptr;
+		if (!Value->TryGetArray(Fields) || !Fields || Fields->Num() != 9)
+		{
+			return TEXT("{\"success\":false,\"error\":\"Each transform must have 9 numbers\"}");
+		}
+
+		double F[9];
+		for (int32 Index = 0; Index < 9; ++Index)
+		{
+			F[Index] = (*Fields)[Index]->AsNumber();
+		}
+
+		Transforms.Emplace(
+			FRotator(F[3], F[4], F[5]),
+			FVector(F[0], F[1], F[2]),
+			FVector(F[6], F[7], F[8]));
+	}
+
+	UE_LOG(LogTemp, Log, TEXT("AgenticControl: spawn_actors type=%s count=%d"),
+		*ActorType, Transforms.Num());
+
+	FString ResultJson;
+	FEvent* DoneEvent = FPlatformProcess::GetSynchEventFromPool();
+
+	AsyncTask(ENamedThreads::GameThread, [&ResultJson, &Transforms, ActorType, DoneEvent]()
+	{
+		UWorld* World = GEditor->GetEditorWorldContext().World();
+		if (!World)
+		{
+			ResultJson = TEXT("{\"success\":false,\"error\":\"No editor world available\"}");
+			DoneEvent->Trigger();
+			return;
+		}
+
+		UClass* ActorClass = GetActorClassFromType(ActorType);
+		if (!ActorClass)
+		{
+			ResultJson = FString::Printf(
+				TEXT("{\"success\":false,\"error\":\"Unknown actor type: %s\"}"), *ActorType);
+			DoneEvent->Trigger();
+			return;
+		}
+
+		UStaticMesh* CubeMesh = nullptr;
+		if (ActorClass->IsChildOf(AStaticMeshActor::StaticClass()))
+		{
+			CubeMesh = LoadObject<UStaticMesh>(nullptr, TEXT("/Engine/BasicShapes/Cube.Cube"));
+		}
+
+		FActorSpawnParameters SpawnParams;
+		SpawnParams.SpawnCollisionHandlingOverride = ESpawnActorCollisionHandlingMethod::AlwaysSpawn;
+
+		FString IdsArray = TEXT("[");
+		int32 Spawned = 0;
+
+		for (const FTransform& Transform : Transforms)
+		{
+			AActor* NewActor = World->SpawnActor(ActorClass, &Transform, SpawnParams);
+			if (!NewActor)
+			{
+				continue;
+			}
+
+			if (AStaticMeshActor* MeshActor = Cast<AStaticMeshActor>(NewActor))
+			{
+				if (CubeMesh && MeshActor->GetStaticMeshComponent())
+				{
+					MeshActor->GetStaticMeshComponent()->SetStaticMesh(CubeMesh);
+				}
+			}
+
+			if (Spawned > 0)
+			{
+				IdsArray += TEXT(",");
+			}
+			IdsArray += FString::Printf(TEXT("\"%s\""), *NewActor->GetActorLabel());
+			++Spawned;
+		}
+
+		IdsArray += TEXT("]");
+
+		if (Spawned == Transforms.Num())
+		{
+			ResultJson = FString::Printf(
+				TEXT("{\"success\":true,\"actor_type\":\"%s\",\"actor_ids\":%s}"),
+				*ActorType, *IdsArray);
+		}
+		else
+		{
+			ResultJson = FString::Printf(
+				TEXT("{\"success\":false,\"error\":\"Spawned %d of %d actors\",\"actor_type\":\"%s\",\"actor_ids\":%s}"),
+				Spawned, Transforms.Num(), *ActorType, *IdsArray);
+		}
+
+		DoneEvent->Trigger();
+	});
+
+	DoneEvent->Wait();
+	FPlatformProcess::ReturnSynchEventToPool(DoneEvent);
+
+	return ResultJson;
+}
+
 // ---------------------------------------------------------------------------
 // get_scene_info — dispatches to game thread, iterates all actors
 // ---------------------------------------------------------------------------
@@ -35,6 +35,9 @@ private:
 	/** Handle spawn_actor command. Returns JSON response. */
 	FString HandleSpawnActor(const TSharedPtr<FJsonObject>& Params);
 
+	/** Handle spawn_actors command. Spawns one actor per transform in a single game-thread task. */
+	FString HandleSpawnActors(const TSharedPtr<FJsonObject>& Params);
+
 	/** Handle get_scene_info command. Returns JSON response. */
 	FString HandleGetSceneInfo();
 